@@ -11,6 +11,7 @@ from app.core.database import Base
 from app.models.user import User
 from app.models.project import Project  
 from app.models.task import Task
+from app.models.outbox import OutboxEvent
 
 # Alembic Config object
 config = context.config
@@ -25,6 +26,14 @@ if config.config_file_name is not None:
 # Target metadata for autogenerate
 target_metadata = Base.metadata
 
+# Trigger-maintained full-text search columns live only in the database
+SEARCH_INDEX_OBJECTS = {"search_vector", "ix_projects_search_vector", "ix_tasks_search_vector"}
+
+def include_object(object, name, type_, reflected, compare_to):
+    if reflected and name in SEARCH_INDEX_OBJECTS:
+        return False
+    return True
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
@@ -33,6 +42,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -46,7 +56,7 @@ def run_migrations_online() -> None:
     )
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,33 @@
+"""add composite indexes for task list filters
+
+Revision ID: 5502fca824a8
+Revises: ed4e9b738785
+Create Date: 2026-10-18 09:12:40.318215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5502fca824a8'
+down_revision: Union[str, Sequence[str], None] = 'ed4e9b738785'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the tasks table stays writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tasks_assigned_to_status_id', 'tasks', ['assigned_to', 'status', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_tasks_project_id_status_id', 'tasks', ['project_id', 'status', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_project_id_status_id', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_assigned_to_status_id', table_name='tasks', postgresql_concurrently=True)
@@ -0,0 +1,59 @@
+"""add full text search to projects and tasks
+
+Revision ID: 72d6c3f7550d
+Revises: 5502fca824a8
+Create Date: 2026-10-18 11:40:05.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '72d6c3f7550d'
+down_revision: Union[str, Sequence[str], None] = '5502fca824a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_TABLES = ('projects', 'tasks')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Title matches (weight A) rank above description matches (weight B).
+    # The config must match TS_CONFIG in app/services/search_service.py.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    for table_name in SEARCH_TABLES:
+        op.add_column(table_name, sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+        op.execute(f"""
+            CREATE TRIGGER {table_name}_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF title, description ON {table_name}
+            FOR EACH ROW EXECUTE FUNCTION search_vector_update()
+        """)
+        # Backfill existing rows through the trigger
+        op.execute(f"UPDATE {table_name} SET title = title")
+
+    with op.get_context().autocommit_block():
+        for table_name in SEARCH_TABLES:
+            op.create_index(f'ix_{table_name}_search_vector', table_name, ['search_vector'], unique=False, postgresql_using='gin', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in SEARCH_TABLES:
+        op.drop_index(f'ix_{table_name}_search_vector', table_name=table_name)
+        op.execute(f"DROP TRIGGER IF EXISTS {table_name}_search_vector_trigger ON {table_name}")
+        op.drop_column(table_name, 'search_vector')
+    op.execute("DROP FUNCTION IF EXISTS search_vector_update()")
@@ -0,0 +1,100 @@
+"""add task counters to projects
+
+Revision ID: c57d61ee51d4
+Revises: b7e3c41d9a26
+Create Date: 2026-10-18 16:20:41.337052
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c57d61ee51d4'
+down_revision: Union[str, Sequence[str], None] = 'b7e3c41d9a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match STATUS_COUNTERS in app/models/task_counters.py
+STATUS_COUNTERS = {
+    'todo': 'todo_count',
+    'in-progress': 'in_progress_count',
+    'done': 'done_count',
+}
+COUNTER_COLUMNS = ('task_count', *STATUS_COUNTERS.values())
+
+
+def _apply_deltas(changes: str) -> str:
+    """UPDATE projects by the net per-project deltas of `changes` (project_id, status, delta)"""
+    sums = ["sum(delta) AS task_count"] + [
+        f"sum(CASE WHEN status = '{status}' THEN delta ELSE 0 END) AS {column}"
+        for status, column in STATUS_COUNTERS.items()
+    ]
+    return f"""
+            UPDATE projects SET {', '.join(f'{column} = projects.{column} + d.{column}' for column in COUNTER_COLUMNS)}
+            FROM (
+                SELECT project_id, {', '.join(sums)}
+                FROM ({changes}) AS changes
+                GROUP BY project_id
+            ) AS d
+            WHERE projects.id = d.project_id
+              AND ({', '.join(f'd.{column}' for column in COUNTER_COLUMNS)}) <> ({', '.join('0' for _ in COUNTER_COLUMNS)});"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in COUNTER_COLUMNS:
+        op.add_column('projects', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+
+    # Statement-level triggers with transition tables: a bulk insert, COPY or
+    # cascade delete updates each affected project once, not once per task.
+    added = "SELECT project_id, status, 1 AS delta FROM new_rows"
+    removed = "SELECT project_id, status, -1 AS delta FROM old_rows"
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION project_task_counters_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN{_apply_deltas(added)}
+            ELSIF TG_OP = 'DELETE' THEN{_apply_deltas(removed)}
+            ELSE{_apply_deltas(f"{added} UNION ALL {removed}")}
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_counters_insert AFTER INSERT ON tasks
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION project_task_counters_update()
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_counters_update AFTER UPDATE ON tasks
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION project_task_counters_update()
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_counters_delete AFTER DELETE ON tasks
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION project_task_counters_update()
+    """)
+
+    # Backfill from the existing tasks
+    status_counts = ", ".join(
+        f"{column} = (SELECT count(*) FROM tasks WHERE tasks.project_id = projects.id AND tasks.status = '{status}')"
+        for status, column in STATUS_COUNTERS.items()
+    )
+    op.execute(f"""
+        UPDATE projects SET
+            task_count = (SELECT count(*) FROM tasks WHERE tasks.project_id = projects.id),
+            {status_counts}
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for trigger in ('tasks_counters_insert', 'tasks_counters_update', 'tasks_counters_delete'):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS project_task_counters_update()")
+    for column in reversed(COUNTER_COLUMNS):
+        op.drop_column('projects', column)
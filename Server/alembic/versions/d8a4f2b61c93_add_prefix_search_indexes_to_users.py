@@ -0,0 +1,38 @@
+"""add prefix search indexes to users
+
+Revision ID: d8a4f2b61c93
+Revises: c57d61ee51d4
+Create Date: 2026-10-18 18:05:12.604219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a4f2b61c93'
+down_revision: Union[str, Sequence[str], None] = 'c57d61ee51d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match USER_DIRECTORY_SEARCH_COLUMNS in app/services/read_queries.py
+PREFIX_SEARCH_COLUMNS = ('first_name', 'last_name', 'email')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # text_pattern_ops lets lower(column) LIKE 'prefix%' use the index
+    # whatever the database collation. Built concurrently so sign-ups and
+    # logins keep working during the migration.
+    with op.get_context().autocommit_block():
+        for column in PREFIX_SEARCH_COLUMNS:
+            op.create_index(f'ix_users_{column}_prefix', 'users', [sa.text(f'lower({column}) text_pattern_ops')], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for column in reversed(PREFIX_SEARCH_COLUMNS):
+            op.drop_index(f'ix_users_{column}_prefix', table_name='users', postgresql_concurrently=True)
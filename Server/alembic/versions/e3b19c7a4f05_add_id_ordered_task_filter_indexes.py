@@ -0,0 +1,33 @@
+"""add id ordered task filter indexes
+
+Revision ID: e3b19c7a4f05
+Revises: d8a4f2b61c93
+Create Date: 2026-10-18 11:02:17.524903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b19c7a4f05'
+down_revision: Union[str, Sequence[str], None] = 'd8a4f2b61c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the tasks table stays writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tasks_assigned_to_id', 'tasks', ['assigned_to', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_tasks_project_id_id', 'tasks', ['project_id', 'id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_project_id_id', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_assigned_to_id', table_name='tasks', postgresql_concurrently=True)
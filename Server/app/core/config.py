@@ -3,6 +3,22 @@ from typing import Optional
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # Defaults to DATABASE_URL with its async driver (asyncpg / aiosqlite)
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # Connection pool, applied to both the sync and the async engine
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Read replicas for the GET endpoints: comma-separated URLs in the form of
+    # DATABASE_URL, each with its own pool. Replicas are health-checked every
+    # DB_REPLICA_CHECK_INTERVAL seconds and skipped while unreachable or more
+    # than DB_REPLICA_MAX_LAG seconds behind (PostgreSQL)
+    DATABASE_REPLICA_URLS: Optional[str] = None
+    DB_REPLICA_CHECK_INTERVAL: float = 5.0
+    DB_REPLICA_CHECK_TIMEOUT: float = 2.0
+    DB_REPLICA_MAX_LAG: float = 5.0
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 600
@@ -16,6 +32,54 @@ class Settings(BaseSettings):
     CELERY_RESULT_BACKEND: str = "redis://127.0.0.1:6379/0"
     BREVO_API_KEY: Optional[str] = None
     BREVO_SENDER_EMAIL: Optional[str] = None
+    BREVO_API_URL: str = "https://api.brevo.com/v3/smtp/email"
+    # Email provider HTTP client, one keep-alive pool per Celery worker process
+    EMAIL_HTTP_POOL_SIZE: int = 10
+    EMAIL_HTTP_CONNECT_TIMEOUT: float = 3.05
+    EMAIL_HTTP_READ_TIMEOUT: float = 10.0
+    EMAIL_HTTP_RETRIES: int = 3
+    # Emails queued in Redis are sent together after this many seconds, up
+    # to EMAIL_BATCH_MAX_SIZE per provider request
+    EMAIL_BATCH_WINDOW: float = 2.0
+    EMAIL_BATCH_MAX_SIZE: int = 100
+    # Outbox relay: events per batch, fallback poll when no commit wakes it,
+    # attempts before a failing event is dropped, and seconds a claimed batch
+    # stays hidden from other relays while it is dispatched
+    OUTBOX_BATCH_SIZE: int = 200
+    OUTBOX_POLL_INTERVAL: float = 1.0
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_CLAIM_TIMEOUT: int = 60
+    # Rows fetched per server-side cursor round trip by the export endpoints
+    EXPORT_CHUNK_SIZE: int = 1000
+    # Task import: records validated and inserted per transaction, and how
+    # many row errors are kept for the summary
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_ERRORS: int = 100
+    # Compiled email template bytecode; defaults to a directory under the system temp dir
+    EMAIL_TEMPLATE_CACHE_DIR: Optional[str] = None
+    # Shared cache / coordination store; features fall back to in-process state when unset
+    REDIS_URL: Optional[str] = None
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    # Cached list/detail responses: seconds an entry lives (0 disables) and
+    # entries kept in each worker's local tier
+    RESPONSE_CACHE_TTL: int = 30
+    RESPONSE_CACHE_MAX_SIZE: int = 1000
+    # bcrypt worker pool: threads (bcrypt releases the GIL) and how many hash
+    # requests may wait for a worker before new ones are rejected
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    PASSWORD_HASH_MAX_QUEUE: int = 256
+    # Rate limiting, counted in Redis (in-process when REDIS_URL is unset)
+    LOGIN_MAX_FAILED_ATTEMPTS: int = 5
+    LOGIN_LOCKOUT_SECONDS: int = 900
+    EMAIL_COOLDOWN_SECONDS: int = 60
+    EMAIL_MAX_PER_HOUR: int = 5
+    # Socket.IO events are queued and emitted once per tick
+    SOCKET_BATCH_INTERVAL_MS: int = 50
+    # Pub/sub that relays Socket.IO emits between workers (redis://, or
+    # memory:// in tests); defaults to REDIS_URL
+    SOCKETIO_MESSAGE_QUEUE: Optional[str] = None
+    SOCKETIO_CHANNEL: str = "socketio"
 
     class Config:
         env_file = ".env"
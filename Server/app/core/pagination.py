@@ -0,0 +1,98 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _encode_value(value: Any) -> dict:
+    if isinstance(value, datetime):
+        return {"t": "dt", "v": value.isoformat()}
+    return {"t": "raw", "v": value}
+
+
+def _decode_value(data: dict) -> Any:
+    return datetime.fromisoformat(data["v"]) if data["t"] == "dt" else data["v"]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Build an opaque cursor token from the last row's sort key values"""
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, width: int) -> list[Any]:
+    """Decode a cursor token back into its sort key values"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(data, list) or len(data) != width:
+            raise ValueError("cursor width mismatch")
+        return [_decode_value(item) for item in data]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def cursor_from_row(row, columns: Sequence) -> str:
+    """Cursor pointing just past the given row"""
+    return encode_cursor([getattr(row, column.key) for column in columns])
+
+
+def _unwrap(rows) -> list:
+    """Single-entity selects come back as plain objects, wider ones as tuples"""
+    if rows and len(rows[0]) == 1:
+        return [row[0] for row in rows]
+    return [tuple(row) for row in rows]
+
+
+async def keyset_paginate(
+    db: AsyncSession, stmt: Select, columns: Sequence, size: int, after: Optional[str] = None, descending: bool = True
+):
+    """
+    Fetch one page ordered by `columns` (the last column must be unique,
+    usually the primary key), seeking past the `after` cursor instead of
+    using OFFSET so deep pages cost the same index seek.
+    Returns: (rows, next_cursor)
+    """
+    if after:
+        values = decode_cursor(after, len(columns))
+        key = tuple_(*columns)
+        bound = tuple_(*[literal(value, column.type) for value, column in zip(values, columns)])
+        stmt = stmt.where(key < bound if descending else key > bound)
+
+    order_by = [column.desc() if descending else column.asc() for column in columns]
+    result = await db.execute(stmt.order_by(*order_by).limit(size + 1))
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        # Read the key before unwrapping: column selects become plain tuples
+        last = rows[-1]
+        next_cursor = cursor_from_row(last[0] if len(last) == 1 else last, columns)
+    return _unwrap(rows), next_cursor
+
+
+async def paginate(db: AsyncSession, stmt: Select, page: int, size: int):
+    """
+    Fetch one OFFSET page and the total row count in a single statement by
+    selecting COUNT(*) OVER () next to the page rows, instead of running a
+    separate count query over the same filters.
+    Returns: (rows, total)
+    """
+    total_column = func.count().over().label("_total")
+    result = await db.execute(stmt.add_columns(total_column).offset((page - 1) * size).limit(size))
+    rows = result.all()
+
+    if not rows:
+        # Nothing matched, or the page is past the end so no row carries the total
+        if page == 1:
+            return [], 0
+        total = await db.scalar(select(func.count()).select_from(stmt.order_by(None).subquery()))
+        return [], total
+
+    total = rows[0]._total
+    return _unwrap([row[:-1] for row in rows]), total
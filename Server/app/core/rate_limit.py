@@ -0,0 +1,139 @@
+import math
+import threading
+import time
+from typing import Optional
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "rate-limit:"
+
+
+class MemoryRateLimitBackend:
+    """Fixed-window counters in process memory; for tests and single-worker development"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, tuple[int, float]] = {}
+
+    def _live(self, key: str, now: float) -> Optional[tuple[int, float]]:
+        entry = self._counters.get(key)
+        if entry is not None and entry[1] <= now:
+            del self._counters[key]
+            return None
+        return entry
+
+    async def hit(self, key: str, window: int) -> tuple[int, float]:
+        with self._lock:
+            now = time.monotonic()
+            entry = self._live(key, now)
+            count, expires_at = entry if entry else (0, now + window)
+            self._counters[key] = (count + 1, expires_at)
+            return count + 1, expires_at - now
+
+    async def reset(self, key: str):
+        with self._lock:
+            self._counters.pop(key, None)
+
+
+class RedisRateLimitBackend:
+    """Fixed-window counters shared by all workers; INCR and EXPIRE run in one MULTI so concurrent hits never race"""
+
+    async def hit(self, key: str, window: int) -> tuple[int, float]:
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, window, nx=True)
+            pipe.pttl(key)
+            count, _, ttl_ms = await pipe.execute()
+        return count, max(ttl_ms, 0) / 1000
+
+    async def reset(self, key: str):
+        await get_redis().delete(key)
+
+
+class RateLimiter:
+    """
+    Counts events per key over a fixed window. Backend errors fail open so
+    an unavailable store never locks every user out.
+    """
+
+    def __init__(self, backend=None):
+        self._backend = backend
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = RedisRateLimitBackend() if get_redis() is not None else MemoryRateLimitBackend()
+        return self._backend
+
+    async def hit(self, key: str, window: int) -> tuple[int, float]:
+        """Record one event; returns (events in the current window, seconds until it resets)"""
+        try:
+            return await self.backend.hit(KEY_PREFIX + key, window)
+        except Exception as e:
+            logger.error(f"Rate limit store unavailable for {key}: {str(e)}")
+            return 0, 0.0
+
+    async def reset(self, key: str):
+        try:
+            await self.backend.reset(KEY_PREFIX + key)
+        except Exception as e:
+            logger.error(f"Rate limit store unavailable for {key}: {str(e)}")
+
+
+rate_limiter = RateLimiter()
+
+
+def _login_key(email: str) -> str:
+    return f"login-failures:{email.lower()}"
+
+
+async def reserve_login_attempt(email: str):
+    """
+    Count a login attempt for an email before its password is checked, and
+    reject it once the lockout window holds more than
+    LOGIN_MAX_FAILED_ATTEMPTS attempts. Counting first means concurrent
+    guesses can't all pass the check before any of them is recorded; a
+    successful login clears the count with reset_login_failures.
+    """
+    attempts, retry_after = await rate_limiter.hit(_login_key(email), settings.LOGIN_LOCKOUT_SECONDS)
+    if attempts > settings.LOGIN_MAX_FAILED_ATTEMPTS:
+        logger.warning(f"Account locked due to multiple failed login attempts: {email}")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account locked. Please signin again later.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+async def reset_login_failures(email: str):
+    await rate_limiter.reset(_login_key(email))
+
+
+async def check_email_send_allowed(email: str, limit_message: str):
+    """
+    Allow one email per cooldown period and at most EMAIL_MAX_PER_HOUR per
+    hour for an address; counts the attempt when allowed.
+    """
+    email = email.lower()
+    attempts, retry_after = await rate_limiter.hit(f"email-cooldown:{email}", settings.EMAIL_COOLDOWN_SECONDS)
+    if attempts > 1:
+        wait_time = math.ceil(retry_after)
+        logger.warning(f"Email rate limit hit for user: {email}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Please wait {wait_time} seconds before requesting another OTP",
+            headers={"Retry-After": str(wait_time)},
+        )
+
+    sent, retry_after = await rate_limiter.hit(f"email-hourly:{email}", 3600)
+    if sent > settings.EMAIL_MAX_PER_HOUR:
+        logger.warning(f"Hourly email limit exceeded for user: {email}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=limit_message,
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
@@ -0,0 +1,34 @@
+from typing import Optional
+import redis
+import redis.asyncio as aioredis
+from app.core.config import settings
+
+_async_client: Optional[aioredis.Redis] = None
+_sync_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """Shared asyncio Redis client, or None when REDIS_URL is not configured"""
+    global _async_client
+    if settings.REDIS_URL is None:
+        return None
+    if _async_client is None:
+        _async_client = aioredis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _async_client
+
+
+def get_sync_redis() -> Optional[redis.Redis]:
+    """Blocking Redis client for the CLI and Celery workers"""
+    global _sync_client
+    if settings.REDIS_URL is None:
+        return None
+    if _sync_client is None:
+        _sync_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _sync_client
+
+
+async def close_redis():
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
@@ -0,0 +1,160 @@
+import asyncio
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import (
+    MeteredAsyncAdaptedQueuePool, async_engine, get_async_database_url, pool_status, _pool_options
+)
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds a standby is behind its primary; 0 when it has replayed everything
+# it received, NULL on a server that is not a standby
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class Replica:
+    def __init__(self, url: str):
+        async_url = get_async_database_url(url)
+        self.name = async_url.render_as_string(hide_password=True)
+        self.engine = create_async_engine(async_url, **_pool_options(async_url, MeteredAsyncAdaptedQueuePool))
+        # Not used until the first health check passes
+        self.healthy = False
+        self.lag: Optional[float] = None
+        self.error: Optional[str] = None
+        self.checked_at: Optional[float] = None
+
+
+class ReplicaPool:
+    """
+    Read replicas for the GET endpoints. Every worker checks each replica
+    every `check_interval` seconds (a round trip, plus replay lag on
+    PostgreSQL) and hands out the healthy ones round-robin, one per
+    session. With no replica configured or none healthy, reads stay on the
+    primary.
+    """
+
+    def __init__(self, urls: list[str], check_interval: float, check_timeout: float, max_lag: float):
+        self.replicas = [Replica(url) for url in urls]
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.max_lag = max_lag
+        self._turn = itertools.count()
+
+    @property
+    def staleness_bound(self) -> float:
+        """Seconds a healthy replica may trail the primary: its allowed lag, which was last measured up to one check ago"""
+        return self.max_lag + self.check_interval
+
+    def pick(self) -> Optional[AsyncEngine]:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._turn) % len(healthy)].engine
+
+    async def _measure_lag(self, replica: Replica) -> float:
+        async with replica.engine.connect() as connection:
+            if connection.dialect.name == "postgresql":
+                return float(await connection.scalar(REPLICA_LAG_QUERY) or 0)
+            await connection.execute(text("SELECT 1"))
+            return 0.0
+
+    async def _check(self, replica: Replica):
+        try:
+            lag = await asyncio.wait_for(self._measure_lag(replica), timeout=self.check_timeout)
+            error = None if lag <= self.max_lag else f"Replication lag {lag:.1f}s over {self.max_lag}s"
+        except Exception as e:
+            lag, error = None, str(e) or type(e).__name__
+        healthy = error is None
+
+        if healthy and not replica.healthy:
+            logger.info(f"Read replica {replica.name} is healthy, routing reads to it")
+        elif not healthy and replica.healthy:
+            logger.warning(f"Read replica {replica.name} failed its health check, routing reads elsewhere: {error}")
+        replica.healthy, replica.lag, replica.error, replica.checked_at = healthy, lag, error, time.time()
+
+    async def check(self):
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    async def run_health_checks(self):
+        """Background task: keep the replicas' health current until cancelled"""
+        while True:
+            await self.check()
+            await asyncio.sleep(self.check_interval)
+
+    def status(self) -> list[dict]:
+        return [
+            {
+                "url": replica.name,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag,
+                "error": replica.error,
+                "checked_at": replica.checked_at,
+                "pool": pool_status(replica.engine.pool),
+            }
+            for replica in self.replicas
+        ]
+
+
+# Set by reads_from_primary(): read sessions send every statement to the primary
+_primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+@contextmanager
+def reads_from_primary():
+    """Route the read sessions' statements in this block to the primary, for reads that must see the latest writes"""
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+class ReadRoutingSession(Session):
+    """
+    Sends plain SELECTs to the replica picked when the session was opened.
+    The first statement that is anything else (a flush, an INSERT/UPDATE/
+    DELETE, SELECT ... FOR UPDATE, raw SQL) switches the session to the
+    primary for good, so a request always reads its own writes. Inside
+    reads_from_primary() it reads from the primary as well.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        replica = replica_pool.pick()
+        self._replica = replica.sync_engine if replica is not None else None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._replica is not None and not _primary_reads.get():
+            if isinstance(clause, Select) and clause._for_update_arg is None and not self._flushing:
+                return self._replica
+            self._replica = None
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+replica_pool = ReplicaPool(
+    urls=[url.strip() for url in (settings.DATABASE_REPLICA_URLS or "").split(",") if url.strip()],
+    check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+    check_timeout=settings.DB_REPLICA_CHECK_TIMEOUT,
+    max_lag=settings.DB_REPLICA_MAX_LAG,
+)
+
+ReadSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, sync_session_class=ReadRoutingSession, autoflush=False, expire_on_commit=False
+)
+
+
+async def get_read_db():
+    """Session for read-only endpoints: SELECTs go to a healthy replica when there is one"""
+    async with ReadSessionLocal() as db:
+        yield db
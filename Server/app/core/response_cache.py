@@ -0,0 +1,285 @@
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Iterable, Optional, Union
+from fastapi import HTTPException, Request, Response
+from pydantic import BaseModel
+from app.core.config import settings
+from app.core.serialization import JSON_MEDIA_TYPE, json_response
+from app.core.redis import get_redis, get_sync_redis
+from app.core.replicas import reads_from_primary, replica_pool
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+REDIS_KEY_PREFIX = "response-cache:"
+REDIS_TAG_PREFIX = "response-cache:tag:"
+REDIS_CLOCK_KEY = "response-cache:clock"
+
+# Tags cached responses depend on; writes bump them after commit
+PROJECTS_TAG = "projects"
+TASKS_TAG = "tasks"
+# Bumped when a project delete cascades to its tasks, which get_task entries can't see otherwise
+PROJECT_DELETIONS_TAG = "project-deletions"
+
+# Visibility of responses that do not depend on the caller
+PUBLIC = "public"
+
+
+def project_tag(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def task_tag(task_id: int) -> str:
+    return f"task:{task_id}"
+
+
+def task_write_tags(project_ids: Iterable[int], task_ids: Iterable[int] = ()) -> list[str]:
+    """Tags to bump after tasks of `project_ids` were created, changed or deleted"""
+    # Project rows carry the task counters, so project lists change too
+    return [TASKS_TAG, PROJECTS_TAG, *{project_tag(project_id) for project_id in project_ids}, *{task_tag(task_id) for task_id in task_ids}]
+
+
+def _tag_value(version: int) -> str:
+    # Redis tag values carry the bump time, so readers can tell a recent write
+    return f"{version}:{time.time()}"
+
+
+def _parse_tag_value(value: Optional[str]) -> tuple[int, float]:
+    """(version, seconds since the bump) of a Redis tag value"""
+    if not value:
+        return 0, math.inf
+    version, _, bumped_at = value.partition(":")
+    return int(version), time.time() - float(bumped_at or "inf")
+
+
+def visibility(user) -> str:
+    """Cache scope for responses that depend on who is asking"""
+    return "admin" if user.role == "admin" else f"user:{user.id}"
+
+
+class ResponseCache:
+    """
+    Serialized API responses in a bounded LRU with a TTL, backed by an
+    optional Redis tier shared across workers. Each entry is keyed by the
+    current versions of the tags it depends on; bumping a tag makes every
+    entry built from older data unreachable, and the LRU/TTL reclaims it.
+    With Redis the tag versions are shared, so a write on one worker
+    invalidates all of them; without it each worker only sees its own
+    writes and the TTL bounds staleness.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str, str, int]] = OrderedDict()
+        self._versions: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @property
+    def _tag_ttl(self) -> int:
+        # A tag may be forgotten (read as 0) once every entry built on a
+        # version of it has expired; versions are unique, so none is reused
+        return self.ttl * 2
+
+    async def versions(self, tags: list[str]) -> Optional[list[tuple[int, float]]]:
+        """
+        Current version of each tag with the seconds since it was bumped, or
+        None when they can't be read (bypass the cache)
+        """
+        client = get_redis()
+        if client is None:
+            with self._lock:
+                now = time.monotonic()
+                return [
+                    (version, now - set_at) if set_at + self._tag_ttl > now else (0, math.inf)
+                    for set_at, version in (self._versions.get(tag, (0.0, 0)) for tag in tags)
+                ]
+        try:
+            return [_parse_tag_value(value) for value in await client.mget([f"{REDIS_TAG_PREFIX}{tag}" for tag in tags])]
+        except Exception as e:
+            logger.warning(f"Response cache Redis version read failed: {str(e)}")
+            return None
+
+    def _get_local(self, key: str) -> Optional[tuple[str, str, int]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, etag, body, status_code = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return etag, body, status_code
+
+    def _set_local(self, key: str, etag: str, body: str, status_code: int):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, etag, body, status_code)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[tuple[str, str, int]]:
+        """(etag, body, status code) of a cached response"""
+        entry = self._get_local(key)
+        if entry is None:
+            client = get_redis()
+            if client is None:
+                return None
+            try:
+                raw = await client.get(f"{REDIS_KEY_PREFIX}{key}")
+            except Exception as e:
+                logger.warning(f"Response cache Redis read failed: {str(e)}")
+                return None
+            if raw is None:
+                return None
+            # "[status ]etag\nbody"; the status is only written for errors
+            header, body = raw.split("\n", 1)
+            status_code, _, etag = header.rpartition(" ")
+            entry = etag, body, int(status_code or 200)
+            self._set_local(key, *entry)
+        return entry
+
+    async def set(self, key: str, etag: str, body: str, status_code: int = 200):
+        self._set_local(key, etag, body, status_code)
+        client = get_redis()
+        if client is not None:
+            header = etag if status_code == 200 else f"{status_code} {etag}"
+            try:
+                await client.set(f"{REDIS_KEY_PREFIX}{key}", f"{header}\n{body}", ex=self.ttl)
+            except Exception as e:
+                logger.warning(f"Response cache Redis write failed: {str(e)}")
+
+    async def invalidate(self, *tags: str):
+        """Call after committing a write that changes data tagged with `tags`"""
+        if not self.enabled or not tags:
+            return
+        client = get_redis()
+        if client is None:
+            self._bump_local(tags)
+            return
+        try:
+            version = await client.incr(REDIS_CLOCK_KEY)
+            async with client.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.set(f"{REDIS_TAG_PREFIX}{tag}", _tag_value(version), ex=self._tag_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Response cache invalidation of {len(tags)} tags failed: {str(e)}")
+
+    def _bump_local(self, tags: Iterable[str]):
+        with self._lock:
+            now = time.monotonic()
+            self._clock += 1
+            for tag in tags:
+                self._versions[tag] = (now, self._clock)
+                self._versions.move_to_end(tag)
+            # Oldest first: forget tags no live entry can depend on
+            while self._versions:
+                set_at, _ = next(iter(self._versions.values()))
+                if set_at + self._tag_ttl > now:
+                    break
+                self._versions.popitem(last=False)
+
+
+def invalidate_sync(*tags: str):
+    """Invalidate cached responses from a synchronous process (CLI, Celery)"""
+    client = get_sync_redis()
+    if client is None or not response_cache.enabled or not tags:
+        return
+    try:
+        version = client.incr(REDIS_CLOCK_KEY)
+        with client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.set(f"{REDIS_TAG_PREFIX}{tag}", _tag_value(version), ex=response_cache._tag_ttl)
+            pipe.execute()
+    except Exception as e:
+        logger.error(f"Response cache invalidation of {len(tags)} tags failed: {str(e)}")
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _respond(request: Request, etag: str, body: str, status_code: int = 200) -> Response:
+    if status_code != 200:
+        # A cached error is raised again, so it is answered like a fresh one
+        raise HTTPException(status_code=status_code, detail=json.loads(body))
+    # Clients may keep the body but must revalidate it on every use
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def _uncached(payload: Union[BaseModel, bytes]):
+    return json_response(payload) if isinstance(payload, bytes) else payload
+
+
+async def cached_response(
+    request: Request,
+    tags: list[str],
+    scope: str,
+    build: Callable[[], Awaitable[Union[BaseModel, bytes]]],
+    exclude_none: bool = True,
+    cache_errors: tuple[int, ...] = (),
+):
+    """
+    Serve the response of `build` from the cache, keyed by the request path
+    and query parameters, the caller's `scope` and the versions of `tags`.
+    Unchanged responses are answered with 304 when the client sends the
+    ETag back in If-None-Match. Exceptions from `build` are not cached,
+    except HTTPExceptions with a status in `cache_errors`, which only depend
+    on the tagged data (e.g. a 404 for a missing row).
+    `build` may return an already encoded JSON body (app/core/serialization.py)
+    instead of a model. A miss on tags written more recently than a replica
+    may trail the primary is built from the primary, so the entry stored
+    under the new versions never holds the data from before the write.
+    """
+    if not response_cache.enabled:
+        return _uncached(await build())
+
+    # Read the versions before the data, so a write racing with this
+    # request can only leave its result under an already outdated key
+    versions = await response_cache.versions(tags)
+    if versions is None:
+        return _uncached(await build())
+
+    params = "&".join(f"{name}={value}" for name, value in sorted(request.query_params.multi_items()))
+    key_source = f"{request.url.path}?{params}|{scope}|" + ",".join(f"{tag}={version}" for tag, (version, _) in zip(tags, versions))
+    key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    entry = await response_cache.get(key)
+    if entry is not None:
+        return _respond(request, *entry)
+
+    try:
+        if min(age for _, age in versions) < replica_pool.staleness_bound:
+            with reads_from_primary():
+                payload = await build()
+        else:
+            payload = await build()
+    except HTTPException as e:
+        if e.status_code in cache_errors:
+            await response_cache.set(key, "", json.dumps(e.detail), e.status_code)
+        raise
+    body = payload.decode("utf-8") if isinstance(payload, bytes) else payload.model_dump_json(exclude_none=exclude_none)
+    etag = f'"{hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]}"'
+    await response_cache.set(key, etag, body)
+    return _respond(request, etag, body)
+
+
+response_cache = ResponseCache(max_size=settings.RESPONSE_CACHE_MAX_SIZE, ttl=settings.RESPONSE_CACHE_TTL)
@@ -0,0 +1,27 @@
+from typing import Iterable, Sequence
+import orjson
+from fastapi import Response
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def rows_to_dicts(rows: Iterable[Sequence], fields: Sequence[str]) -> list[dict]:
+    """
+    Turn selected-column row tuples into response items, in `fields` order.
+    None values are left out, as response_model_exclude_none does.
+    """
+    return [{field: value for field, value in zip(fields, row) if value is not None} for row in rows]
+
+
+def dump_api_response(data: dict) -> bytes:
+    """
+    Encode an APIResponse envelope with orjson, skipping response_model
+    validation. Produces the same JSON as APIResponse[...] with
+    response_model_exclude_none: compact, fields in model order, naive
+    datetimes in ISO format.
+    """
+    return orjson.dumps({"success": True, "data": {key: value for key, value in data.items() if value is not None}})
+
+
+def json_response(body: bytes) -> Response:
+    return Response(content=body, media_type=JSON_MEDIA_TYPE)
@@ -1,11 +1,193 @@
+import asyncio
+from collections import OrderedDict
+from typing import Iterable, Optional
+from urllib.parse import parse_qs
 import socketio
+from socketio.async_pubsub_manager import AsyncPubSubManager
+from app.core.config import settings
+from app.core.security import decode_token
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class InProcessPubSubManager(AsyncPubSubManager):
+    """
+    Message-queue manager whose "broker" is a set of asyncio queues in this
+    process. Lets tests run several servers in one event loop and exercise
+    the same cross-server path as Redis.
+    """
+
+    name = 'inprocess'
+    _subscribers: dict[str, set[asyncio.Queue]] = {}
+
+    async def _publish(self, data):
+        message = self.json.dumps(data)
+        for queue in self._subscribers.get(self.channel, ()):
+            queue.put_nowait(message)
+
+    async def _listen(self):
+        queue = asyncio.Queue()
+        self._subscribers.setdefault(self.channel, set()).add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[self.channel].discard(queue)
+
+
+def create_client_manager(url: Optional[str], write_only: bool = False):
+    """
+    Pick the Socket.IO client manager for a message-queue URL: Redis pub/sub
+    (redis:// or rediss://) so emits reach sockets held by every worker,
+    memory:// for the in-process fake, or None for a single-process server.
+    """
+    if not url:
+        return None
+    if url.startswith("memory://"):
+        return InProcessPubSubManager(channel=settings.SOCKETIO_CHANNEL, write_only=write_only)
+    if url.startswith(("redis://", "rediss://")):
+        return socketio.AsyncRedisManager(url, channel=settings.SOCKETIO_CHANNEL, write_only=write_only)
+    raise ValueError(f"Unsupported SOCKETIO_MESSAGE_QUEUE: {url}")
+
+
+sio = socketio.AsyncServer(
+    async_mode='asgi',
+    cors_allowed_origins="*",
+    client_manager=create_client_manager(settings.SOCKETIO_MESSAGE_QUEUE or settings.REDIS_URL),
+)
+
+
+def project_room(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def user_room(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def task_rooms(task) -> list[str]:
+    """Clients viewing the task's project and the assignee"""
+    rooms = [project_room(task.project_id)]
+    if task.assigned_to is not None:
+        rooms.append(user_room(task.assigned_to))
+    return rooms
+
+
+def _token_from(environ, auth) -> Optional[str]:
+    if isinstance(auth, dict) and auth.get("token"):
+        return auth["token"]
+    tokens = parse_qs(environ.get("QUERY_STRING", "")).get("token")
+    return tokens[0] if tokens else None
 
-sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins="*")
 
 @sio.event
-async def connect(sid, environ):
-    print(f"Client connected: {sid}")
+async def connect(sid, environ, auth=None):
+    token = _token_from(environ, auth)
+    payload = decode_token(token) if token else None
+    if not payload or payload.get("user_id") is None:
+        logger.warning(f"Socket connection rejected - invalid token: {sid}")
+        raise socketio.exceptions.ConnectionRefusedError("Invalid credentials")
+
+    user_id = payload["user_id"]
+    await sio.save_session(sid, {"user_id": user_id})
+    await sio.enter_room(sid, user_room(user_id))
+    logger.info(f"Client connected: {sid} (user {user_id})")
+
 
 @sio.event
-async def disconnect(sid):
-    print(f"Client disconnected: {sid}")
+async def disconnect(sid, reason=None):
+    logger.info(f"Client disconnected: {sid}")
+
+
+@sio.event
+async def join_project(sid, data):
+    try:
+        project_id = int(data["project_id"])
+    except (KeyError, TypeError, ValueError):
+        return {"success": False, "message": "project_id is required"}
+    await sio.enter_room(sid, project_room(project_id))
+    return {"success": True}
+
+
+@sio.event
+async def leave_project(sid, data):
+    try:
+        project_id = int(data["project_id"])
+    except (KeyError, TypeError, ValueError):
+        return {"success": False, "message": "project_id is required"}
+    await sio.leave_room(sid, project_room(project_id))
+    return {"success": True}
+
+
+class SocketEventBatcher:
+    """
+    Queues events in-process and emits them once per tick, so a request only
+    pays for a dict insert. Events sharing a key within a tick (e.g. several
+    updates to one task) are coalesced into the latest payload, sent to the
+    union of their rooms. Each event may name its `source` (an outbox row);
+    flush() reports the sources whose emit failed so they can be retried.
+    """
+
+    def __init__(self, server: socketio.AsyncServer, interval: float):
+        self.server = server
+        self.interval = interval
+        self._pending: OrderedDict[tuple, tuple[dict, set, set]] = OrderedDict()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._emitting = False
+        self._sequence = 0
+
+    def publish(self, event: str, data: dict, rooms: Iterable[str], key=None, source=None):
+        if key is None:
+            self._sequence += 1
+            key = ("seq", self._sequence)
+        self._queue((event, key), data, set(rooms), {source} if source is not None else set())
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_after_tick())
+
+    def _queue(self, pending_key: tuple, data: dict, rooms: set, sources: set):
+        # A newer payload for the same key wins; rooms and sources accumulate
+        pending = self._pending.get(pending_key)
+        if pending:
+            rooms, sources = rooms | pending[1], sources | pending[2]
+        self._pending[pending_key] = (data, rooms, sources)
+
+    async def _flush_after_tick(self):
+        try:
+            await asyncio.sleep(self.interval)
+            self._emitting = True
+            # Keep failed events for the next flush, which reports them
+            for pending_key, (data, rooms, sources) in (await self._emit_pending()).items():
+                if pending_key in self._pending:
+                    data = self._pending[pending_key][0]
+                self._queue(pending_key, data, rooms, sources)
+        finally:
+            self._emitting = False
+            self._flush_task = None
+
+    async def _emit_pending(self) -> OrderedDict:
+        """Emit everything queued; returns the entries whose emit failed"""
+        pending, self._pending = self._pending, OrderedDict()
+        failed = OrderedDict()
+        for (event, key), (data, rooms, sources) in pending.items():
+            try:
+                await self.server.emit(event, data, to=sorted(rooms))
+            except Exception as e:
+                logger.error(f"Failed to emit socket event {event}: {str(e)}")
+                failed[(event, key)] = (data, rooms, sources)
+        return failed
+
+    async def flush(self) -> set:
+        """Emit everything still queued; returns the sources of events that could not be emitted"""
+        tick = self._flush_task
+        if tick is not None:
+            # A tick still waiting is cancelled; one already emitting is let
+            # finish, since the events it took are not queued anymore
+            if not self._emitting:
+                tick.cancel()
+            await asyncio.gather(tick, return_exceptions=True)
+        return set().union(*(sources for _, _, sources in (await self._emit_pending()).values()))
+
+
+socket_events = SocketEventBatcher(sio, interval=settings.SOCKET_BATCH_INTERVAL_MS / 1000)
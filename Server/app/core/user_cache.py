@@ -0,0 +1,165 @@
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import DateTime
+from app.core.config import settings
+from app.core.redis import get_redis, get_sync_redis
+from app.core.logger import get_logger
+from app.models.user import User
+
+logger = get_logger(__name__)
+
+REDIS_KEY_PREFIX = "user-cache:"
+INVALIDATION_CHANNEL = "user-cache:invalidate"
+
+# Credentials and OTPs never leave the database
+EXCLUDED_COLUMNS = {"hashed_password", "otp", "otp_expiry"}
+CACHED_COLUMNS = [column for column in User.__table__.columns if column.name not in EXCLUDED_COLUMNS]
+
+
+def _serialize(user: User) -> dict:
+    data = {}
+    for column in CACHED_COLUMNS:
+        value = getattr(user, column.name)
+        data[column.name] = value.isoformat() if isinstance(value, datetime) else value
+    return data
+
+
+def _deserialize(data: dict) -> User:
+    values = {}
+    for column in CACHED_COLUMNS:
+        value = data.get(column.name)
+        if value is not None and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        values[column.name] = value
+    # Detached instance: read-only snapshot for authorization checks
+    return User(**values)
+
+
+class UserCache:
+    """
+    Bounded LRU of authenticated users with a TTL, backed by an optional
+    Redis tier shared across workers. Invalidations are broadcast over Redis
+    pub/sub so every worker drops its local copy.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[int, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def generation(self) -> int:
+        """Take before reading a user from the database; pass to set()"""
+        return self._generation
+
+    def _get_local(self, user_id: int) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return data
+
+    def _set_local(self, user_id: int, data: dict, generation: int):
+        with self._lock:
+            # An invalidation raced with the database read; don't cache a stale row
+            if generation != self._generation:
+                return
+            self._entries[user_id] = (time.monotonic() + self.ttl, data)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def evict_local(self, user_id: int):
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(user_id, None)
+
+    async def get(self, user_id: int) -> Optional[User]:
+        data = self._get_local(user_id)
+        if data is None:
+            client = get_redis()
+            if client is None:
+                return None
+            generation = self.generation()
+            try:
+                raw = await client.get(f"{REDIS_KEY_PREFIX}{user_id}")
+            except Exception as e:
+                logger.warning(f"User cache Redis read failed: {str(e)}")
+                return None
+            if raw is None:
+                return None
+            data = json.loads(raw)
+            self._set_local(user_id, data, generation)
+        return _deserialize(data)
+
+    async def set(self, user: User, generation: int):
+        if self.ttl <= 0:
+            return
+        data = _serialize(user)
+        self._set_local(user.id, data, generation)
+        client = get_redis()
+        if client is not None:
+            try:
+                await client.set(f"{REDIS_KEY_PREFIX}{user.id}", json.dumps(data), ex=self.ttl)
+            except Exception as e:
+                logger.warning(f"User cache Redis write failed: {str(e)}")
+
+    async def invalidate(self, user_id: int):
+        self.evict_local(user_id)
+        client = get_redis()
+        if client is not None:
+            try:
+                await client.delete(f"{REDIS_KEY_PREFIX}{user_id}")
+                await client.publish(INVALIDATION_CHANNEL, str(user_id))
+            except Exception as e:
+                logger.error(f"User cache invalidation for user {user_id} failed: {str(e)}")
+
+    async def listen_for_invalidations(self):
+        """Evict local entries invalidated by other workers or the CLI; runs for the app lifetime"""
+        client = get_redis()
+        if client is None:
+            return
+        while True:
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.evict_local(int(message["data"]))
+            except asyncio.CancelledError:
+                await pubsub.aclose()
+                raise
+            except Exception as e:
+                await pubsub.aclose()
+                logger.warning(f"User cache invalidation listener disconnected: {str(e)}")
+                # Entries may have missed invalidations while disconnected
+                with self._lock:
+                    self._generation += 1
+                    self._entries.clear()
+                await asyncio.sleep(1)
+
+
+def invalidate_user_sync(user_id: int):
+    """Invalidate a cached user from a synchronous process (CLI, Celery)"""
+    client = get_sync_redis()
+    if client is None:
+        return
+    try:
+        client.delete(f"{REDIS_KEY_PREFIX}{user_id}")
+        client.publish(INVALIDATION_CHANNEL, str(user_id))
+    except Exception as e:
+        logger.error(f"User cache invalidation for user {user_id} failed: {str(e)}")
+
+
+user_cache = UserCache(max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL)
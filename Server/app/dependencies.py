@@ -1,15 +1,16 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
 from app.core.security import decode_token
+from app.core.user_cache import user_cache
 from app.models.user import User
 from app.core.logger import get_logger
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/token")
 logger = get_logger(__name__)
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -25,18 +26,24 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         logger.warning("Invalid token - missing user_id")
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await user_cache.get(user_id)
+    if user is not None:
+        return user
+    
+    generation = user_cache.generation()
+    user = await db.get(User, user_id)
     if user is None:
         logger.warning(f"User not found for token with user_id: {user_id}")
         raise credentials_exception
     
+    await user_cache.set(user, generation)
     return user
 
 class RoleChecker:
     def __init__(self, allowed_roles: list[str]):
         self.allowed_roles = allowed_roles
 
-    def __call__(self, current_user: User = Depends(get_current_user)):
+    async def __call__(self, current_user: User = Depends(get_current_user)):
         logger.info(f"Checking roles for user {current_user.id} with role {current_user.role} against allowed roles: {self.allowed_roles}")
         if current_user.role not in self.allowed_roles:
             logger.warning(f"User {current_user.id} with role {current_user.role} denied access - required roles: {self.allowed_roles}")
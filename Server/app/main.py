@@ -1,13 +1,36 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.routers import auth, projects, task
+from app.routers import auth, projects, task, internal
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 import socketio
-from app.core.socket import sio
+from app.core.socket import sio, socket_events
+from app.core.redis import close_redis
+from app.core.user_cache import user_cache
+from app.core.replicas import replica_pool
+from app.services.outbox import outbox_relay
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    relay_task = asyncio.create_task(outbox_relay.run())
+    background_tasks = [
+        asyncio.create_task(user_cache.listen_for_invalidations()),
+    ]
+    if replica_pool.replicas:
+        background_tasks.append(asyncio.create_task(replica_pool.run_health_checks()))
+    yield
+    outbox_relay.stop()
+    await relay_task
+    for background_task in background_tasks:
+        background_task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await socket_events.flush()
+    await close_redis()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 socket_app = socketio.ASGIApp(sio, other_asgi_app=app)
 
 #apply cors middleware for frontend route
@@ -27,6 +50,7 @@ def read_root():
 app.include_router(auth.router)
 app.include_router(projects.router)
 app.include_router(task.router)
+app.include_router(internal.router)
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
\ No newline at end of file
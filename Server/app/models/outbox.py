@@ -0,0 +1,22 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+from app.core.database import Base
+
+
+class OutboxEvent(Base):
+    """
+    Notification written in the same transaction as the change it reports;
+    the outbox relay dispatches it after commit and then deletes it.
+    """
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # The relay picks due events oldest first
+        Index("ix_outbox_events_available_at_id", "available_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)  # "socket" or "email"
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
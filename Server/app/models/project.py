@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.models.search_index import register_sqlite_fts
 
 class Project(Base):
     __tablename__ = "projects"
@@ -12,6 +13,15 @@ class Project(Base):
     created_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # Maintained by database triggers on tasks (see app/models/task_counters.py);
+    # rebuild with `python manage.py rebuild-task-counts`
+    task_count = Column(Integer, nullable=False, server_default="0")
+    todo_count = Column(Integer, nullable=False, server_default="0")
+    in_progress_count = Column(Integer, nullable=False, server_default="0")
+    done_count = Column(Integer, nullable=False, server_default="0")
 
     creator = relationship("User", back_populates="projects")
-    tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
\ No newline at end of file
+    tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
+
+
+register_sqlite_fts(Project.__table__)
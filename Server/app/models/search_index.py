@@ -0,0 +1,23 @@
+from sqlalchemy import DDL, Table, event
+
+
+def register_sqlite_fts(table: Table) -> None:
+    """
+    Attach an FTS5 index over title/description, kept current by triggers,
+    whenever metadata.create_all builds `table` on SQLite. PostgreSQL gets
+    its tsvector column and GIN index from the Alembic migration instead.
+    """
+    name = table.name
+    statements = [
+        f"CREATE VIRTUAL TABLE {name}_fts USING fts5(title, description, content='{name}', content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER {name}_fts_ai AFTER INSERT ON {name} BEGIN "
+        f"INSERT INTO {name}_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+        f"CREATE TRIGGER {name}_fts_ad AFTER DELETE ON {name} BEGIN "
+        f"INSERT INTO {name}_fts({name}_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); END",
+        f"CREATE TRIGGER {name}_fts_au AFTER UPDATE OF title, description ON {name} BEGIN "
+        f"INSERT INTO {name}_fts({name}_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description); "
+        f"INSERT INTO {name}_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    ]
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(table, "before_drop", DDL(f"DROP TABLE IF EXISTS {name}_fts").execute_if(dialect="sqlite"))
@@ -1,11 +1,21 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.models.search_index import register_sqlite_fts
+from app.models.task_counters import register_sqlite_task_counters
 
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serve the assignee / project filters (optionally narrowed by status) of the task list endpoints
+        Index("ix_tasks_assigned_to_status_id", "assigned_to", "status", "id"),
+        Index("ix_tasks_project_id_status_id", "project_id", "status", "id"),
+        # Without a status filter the lists walk one assignee's / project's tasks in id order
+        Index("ix_tasks_assigned_to_id", "assigned_to", "id"),
+        Index("ix_tasks_project_id_id", "project_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
@@ -19,3 +29,7 @@ class Task(Base):
 
     project = relationship("Project", back_populates="tasks")
     assignee = relationship("User", foreign_keys=[assigned_to], back_populates="assigned_tasks")  # Who it's assigned to
+
+
+register_sqlite_fts(Task.__table__)
+register_sqlite_task_counters(Task.__table__)
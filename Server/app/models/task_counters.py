@@ -0,0 +1,33 @@
+from sqlalchemy import DDL, Table, event
+
+# Task status -> per-status counter column on projects. Tasks in any other
+# status only count towards projects.task_count.
+STATUS_COUNTERS = {
+    "todo": "todo_count",
+    "in-progress": "in_progress_count",
+    "done": "done_count",
+}
+
+
+def _counter_changes(row: str, sign: str) -> str:
+    changes = [f"task_count = task_count {sign} 1"]
+    changes += [f"{column} = {column} {sign} ({row}.status IS '{status}')" for status, column in STATUS_COUNTERS.items()]
+    return ", ".join(changes)
+
+
+def register_sqlite_task_counters(table: Table) -> None:
+    """
+    Keep the task counters of projects current with triggers on `table`
+    whenever metadata.create_all builds it on SQLite. PostgreSQL gets
+    statement-level triggers from the Alembic migration instead.
+    """
+    name = table.name
+    add = f"UPDATE projects SET {_counter_changes('new', '+')} WHERE id = new.project_id;"
+    remove = f"UPDATE projects SET {_counter_changes('old', '-')} WHERE id = old.project_id;"
+    statements = [
+        f"CREATE TRIGGER {name}_counters_ai AFTER INSERT ON {name} BEGIN {add} END",
+        f"CREATE TRIGGER {name}_counters_ad AFTER DELETE ON {name} BEGIN {remove} END",
+        f"CREATE TRIGGER {name}_counters_au AFTER UPDATE OF project_id, status ON {name} BEGIN {remove} {add} END",
+    ]
+    for statement in statements:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
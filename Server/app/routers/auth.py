@@ -1,31 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
-from app.schemas.user import UserResponse, UserLogin, UserRegister
-from app.core.database import get_db
-from app.core.security import verify_password, create_access_token, hash_password
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.user import UserResponse, UserLogin, UserRegister, UserDirectoryResponse
+from app.core.database import get_async_db
+from app.core.replicas import get_read_db
+from app.core.pagination import keyset_paginate
+from app.core.serialization import rows_to_dicts, dump_api_response, json_response
+from app.services.read_queries import (
+    USER_DIRECTORY_FIELDS, USER_DIRECTORY_SEARCH_COLUMNS, USER_DIRECTORY_SORT_KEY, select_user_directory
+)
+from app.services.search_service import apply_prefix_search
+from app.core.security import verify_password_async, create_access_token, hash_password_async
 from app.schemas.common import APIResponse
 from app.services.email_service import EmailService
+from app.services import outbox
 from app.core.logger import get_logger
 from fastapi.security import OAuth2PasswordRequestForm
 from app.models.user import User
 from app.dependencies import get_current_user
-from datetime import datetime, timedelta, timezone
-from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-
-
-
-TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
-
-# Setup Jinja2 environment
-env = Environment(
-    loader=FileSystemLoader(searchpath=str(TEMPLATES_DIR)),
-    autoescape=select_autoescape(['html', 'xml'])
-)
-
-
-
+from app.core.user_cache import user_cache
+from app.core.rate_limit import reserve_login_attempt, reset_login_failures, check_email_send_allowed
+from datetime import datetime, timedelta
+from typing import Optional
 
 
 
@@ -34,32 +30,19 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 logger = get_logger(__name__)
 
 @router.post("/register", response_model=APIResponse[UserResponse], response_model_exclude_none=True)
-async def register_user(user: UserRegister, db: Session = Depends(get_db)):
+async def register_user(user: UserRegister, db: AsyncSession = Depends(get_async_db)):
     logger.info(f"Registration attempt for email: {user.email}")
     
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = await db.scalar(select(User).where(User.email == user.email))
     if db_user:
         logger.warning(f"Registration failed - email already exists: {user.email}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
     
-    hashed_password = hash_password(user.password)
+    hashed_password = await hash_password_async(user.password)
     # Generate and send verification OTP
     otp = EmailService.generate_otp()
-    template = env.get_template('email-verification.html')
-    html = template.render(
-        otp=otp,
-        first_name=user.first_name,
-        email=user.email,
-    )
-
     otp_expiry = datetime.utcnow() + timedelta(minutes=5)
-    current_time = datetime.utcnow()
-    
-    task = EmailService.send_email.delay(
-        to_email=user.email,
-        subject="Verify your email",
-        html_content=html
-    )
+    await check_email_send_allowed(user.email, "Too many OTP requests. Please try again after 1 hour")
 
     new_user = User(
         email=user.email,
@@ -67,13 +50,20 @@ async def register_user(user: UserRegister, db: Session = Depends(get_db)):
         last_name=user.last_name,
         hashed_password=hashed_password,
         otp=otp,
-        otp_expiry=otp_expiry,
-        email_attempts=1,
-        last_email_attempt=current_time
+        otp_expiry=otp_expiry
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    # Committed with the user, so the email is sent only if the account exists
+    outbox.add_email(
+        db,
+        to_email=user.email,
+        subject="Verify your email",
+        template_name='email-verification.html',
+        context={"otp": otp, "first_name": user.first_name, "email": user.email}
+    )
+    await db.commit()
+    outbox.notify()
+    await db.refresh(new_user)
     logger.info(f"User registered successfully: {new_user.id} - {user.email}")
 
     return {
@@ -84,10 +74,10 @@ async def register_user(user: UserRegister, db: Session = Depends(get_db)):
 
 
 @router.post("/verify-otp", response_model=APIResponse[UserResponse], response_model_exclude_none=True)
-def verify_otp(email: str, otp: str, db: Session = Depends(get_db)):
+async def verify_otp(email: str, otp: str, db: AsyncSession = Depends(get_async_db)):
     logger.info(f"OTP verification attempt for email: {email}")
     
-    db_user = db.query(User).filter(User.email == email).first()
+    db_user = await db.scalar(select(User).where(User.email == email))
     if not db_user:
         logger.warning(f"OTP verification failed - user not found: {email}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -110,8 +100,9 @@ def verify_otp(email: str, otp: str, db: Session = Depends(get_db)):
     
     db_user.is_verified = True
     db_user.otp = None  # Clear OTP after successful verification
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await user_cache.invalidate(db_user.id)
+    await db.refresh(db_user)
     logger.info(f"OTP verified successfully for user: {db_user.id} - {email}")
     
     return {
@@ -124,25 +115,24 @@ def verify_otp(email: str, otp: str, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=APIResponse[UserResponse])
-def login_user(user: UserLogin, db: Session = Depends(get_db)):
+async def login_user(user: UserLogin, db: AsyncSession = Depends(get_async_db)):
     logger.info(f"Login attempt for email: {user.email}")
+
+    # Every attempt counts until one succeeds; locked-out emails are
+    # rejected before touching the database
+    await reserve_login_attempt(user.email)
     
-    db_user = db.query(User).filter(User.email == user.email).first()
+    db_user = await db.scalar(select(User).where(User.email == user.email))
     if not db_user:
         logger.warning(f"Failed login attempt for email: {user.email}")
         raise HTTPException( status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-    
-    if db_user.login_attempts > 5:
-        logger.warning(f"Account locked due to multiple failed login attempts: {user.email}")
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account locked. Please signin again later.")
-
 
-    if not verify_password(user.password, db_user.hashed_password):
+    if not await verify_password_async(user.password, db_user.hashed_password):
         logger.warning(f"Wrong Password for email: {user.email}")
-        db_user.login_attempts += 1
-        db.commit()
         raise HTTPException( status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+    await reset_login_failures(user.email)
+
     if not db_user.is_verified:
         logger.warning(f"Failed login attempt - unverified email: {user.email}")
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Email not verified") 
@@ -174,40 +164,55 @@ def read_current_user(current_user: User = Depends(get_current_user)):
 
 
 
-@router.get("/users", response_model=APIResponse[list[UserResponse]], response_model_exclude_none=True)
-def get_all_users(
+@router.get("/users", response_model=APIResponse[UserDirectoryResponse], response_model_exclude_none=True)
+async def get_all_users(
+    search: Optional[str] = Query(None, description="Name or email prefix; with several words, each must prefix the first name, last name or email"),
+    size: int = Query(20, ge=1, le=100),
+    after: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    logger.info(f"User {current_user.id} fetching all users")
+    logger.info(f"User {current_user.id} fetching user directory - search: {search}, size: {size}, after: {after}")
     
-    users = db.query(User).all()
+    # A page of the directory, not the whole users table: pickers search and
+    # load more instead of fetching everyone up front
+    query = select_user_directory()
+    if search:
+        query = apply_prefix_search(query, USER_DIRECTORY_SEARCH_COLUMNS, search)
     
-    return {
-        "success": True,
-        "data": [UserResponse.model_validate(user) for user in users],
-        "message": "Users fetched successfully"
-    }
+    rows, next_cursor = await keyset_paginate(db, query, USER_DIRECTORY_SORT_KEY, size, after, descending=False)
+    
+    logger.info(f"Retrieved {len(rows)} users")
+    
+    return json_response(dump_api_response({
+        "users": rows_to_dicts(rows, USER_DIRECTORY_FIELDS),
+        "size": size,
+        "next_cursor": next_cursor
+    }))
 
 
 
 
 @router.post("/token")
 async def login_for_swagger(
-    form_data: OAuth2PasswordRequestForm = Depends()
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db)
 ):
     logger.info(f"Swagger OAuth2 login attempt for: {form_data.username}")
+
+    await reserve_login_attempt(form_data.username)
     
-    db = next(get_db())
-    db_user = db.query(User).filter(User.email == form_data.username).first()
+    db_user = await db.scalar(select(User).where(User.email == form_data.username))
     
-    if not db_user or not verify_password(form_data.password, db_user.hashed_password):
+    if not db_user or not await verify_password_async(form_data.password, db_user.hashed_password):
         logger.warning(f"Failed Swagger OAuth2 login for: {form_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    await reset_login_failures(form_data.username)
     
     access_token_expires = timedelta(minutes=600)
     access_token = create_access_token(
@@ -226,10 +231,10 @@ async def login_for_swagger(
 
 
 @router.post("/resend-otp", response_model=APIResponse[None])
-def resend_otp(email: str, db: Session = Depends(get_db)):
+async def resend_otp(email: str, db: AsyncSession = Depends(get_async_db)):
     logger.info(f"Resend OTP request for email: {email}")
     
-    db_user = db.query(User).filter(User.email == email).first()
+    db_user = await db.scalar(select(User).where(User.email == email))
     if not db_user:
         logger.warning(f"Resend OTP failed - user not found: {email}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -241,52 +246,22 @@ def resend_otp(email: str, db: Session = Depends(get_db)):
             "message": "User already verified"
         }
     
-    # Check rate limiting for email sending
-    current_time = datetime.utcnow()
-    if db_user.last_email_attempt:
-        time_since_last_attempt = (current_time - db_user.last_email_attempt).total_seconds()
-        
-        # If less than 1 minute since last attempt
-        if time_since_last_attempt < 60:
-            wait_time = int(60 - time_since_last_attempt)
-            logger.warning(f"Email rate limit hit for user: {email}")
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Please wait {wait_time} seconds before requesting another OTP"
-            )
-        
-        # Reset counter if more than 1 hour has passed
-        if time_since_last_attempt > 3600:
-            db_user.email_attempts = 0
-    
-    # Check if user has exceeded daily limit (5 emails per hour)
-    if db_user.email_attempts >= 5:
-        logger.warning(f"Daily email limit exceeded for user: {email}")
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many OTP requests. Please try again after 1 hour"
-        )
+    # Cooldown and hourly cap are counted in the rate-limit store, not on the user row
+    await check_email_send_allowed(email, "Too many OTP requests. Please try again after 1 hour")
     
     otp = EmailService.generate_otp()
     otp_expiry = datetime.utcnow() + timedelta(minutes=5)
     db_user.otp = otp
     db_user.otp_expiry = otp_expiry
-    db_user.email_attempts += 1
-    db_user.last_email_attempt = current_time
-    db.commit()
-
-    template = env.get_template('email-verification.html')
-    html = template.render(
-        otp=otp,
-        first_name=db_user.first_name,
-        email=db_user.email,
-    )
-    
-    task = EmailService.send_email.delay(
+    outbox.add_email(
+        db,
         to_email=db_user.email,
         subject="Email Verification OTP",
-        html_content=html
+        template_name='email-verification.html',
+        context={"otp": otp, "first_name": db_user.first_name, "email": db_user.email}
     )
+    await db.commit()
+    outbox.notify()
     
     logger.info(f"OTP resent successfully to email: {email}")
     
@@ -299,60 +274,30 @@ def resend_otp(email: str, db: Session = Depends(get_db)):
 
 
 @router.post("/forgot-password", response_model=APIResponse[None])
-def forgot_password(email: str, db: Session = Depends(get_db)):
+async def forgot_password(email: str, db: AsyncSession = Depends(get_async_db)):
     logger.info(f"Forgot password request for email: {email}")
     
-    db_user = db.query(User).filter(User.email == email).first()
+    db_user = await db.scalar(select(User).where(User.email == email))
     if not db_user:
         logger.warning(f"Forgot password failed - user not found: {email}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
-    # Check rate limiting for email sending
-    current_time = datetime.utcnow()
-    if db_user.last_email_attempt:
-        time_since_last_attempt = (current_time - db_user.last_email_attempt).total_seconds()
-        
-        # If less than 1 minute since last attempt
-        if time_since_last_attempt < 60:
-            wait_time = int(60 - time_since_last_attempt)
-            logger.warning(f"Email rate limit hit for user: {email}")
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Please wait {wait_time} seconds before requesting another OTP"
-            )
-        
-        # Reset counter if more than 1 hour has passed
-        if time_since_last_attempt > 3600:
-            db_user.email_attempts = 0
-    
-    # Check if user has exceeded daily limit (5 emails per hour)
-    if db_user.email_attempts >= 5:
-        logger.warning(f"Daily email limit exceeded for user: {email}")
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many password reset requests. Please try again after 1 hour"
-        )
+    # Cooldown and hourly cap are counted in the rate-limit store, not on the user row
+    await check_email_send_allowed(email, "Too many password reset requests. Please try again after 1 hour")
     
     otp = EmailService.generate_otp()
     otp_expiry = datetime.utcnow() + timedelta(minutes=10)
     db_user.otp = otp
     db_user.otp_expiry = otp_expiry
-    db_user.email_attempts += 1
-    db_user.last_email_attempt = current_time
-    db.commit()
-
-    template = env.get_template('password-reset.html')
-    html = template.render(
-        otp=otp,
-        first_name=db_user.first_name,
-        email=db_user.email,
-    )
-    
-    task = EmailService.send_email.delay(
+    outbox.add_email(
+        db,
         to_email=db_user.email,
         subject="Password Reset OTP",
-        html_content=html
+        template_name='password-reset.html',
+        context={"otp": otp, "first_name": db_user.first_name, "email": db_user.email}
     )
+    await db.commit()
+    outbox.notify()
     
     logger.info(f"Password reset OTP sent successfully to email: {email}")
     
@@ -366,10 +311,10 @@ def forgot_password(email: str, db: Session = Depends(get_db)):
 
 
 @router.post("/reset-password", response_model=APIResponse[None])
-def reset_password(email: str, otp: str, new_password: str, db: Session = Depends(get_db)):
+async def reset_password(email: str, otp: str, new_password: str, db: AsyncSession = Depends(get_async_db)):
     logger.info(f"Reset password attempt for email: {email}")
     
-    db_user = db.query(User).filter(User.email == email).first()
+    db_user = await db.scalar(select(User).where(User.email == email))
     if not db_user:
         logger.warning(f"Reset password failed - user not found: {email}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -382,10 +327,11 @@ def reset_password(email: str, otp: str, new_password: str, db: Session = Depend
         logger.warning(f"Reset password failed - OTP expired for email: {email}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="OTP has expired")
     
-    db_user.hashed_password = hash_password(new_password)
+    db_user.hashed_password = await hash_password_async(new_password)
     db_user.otp = None  # Clear OTP after successful password reset
     db_user.otp_expiry = None  # Clear OTP expiry after successful password reset
-    db.commit()
+    await db.commit()
+    await user_cache.invalidate(db_user.id)
     
     logger.info(f"Password reset successfully for user: {db_user.id} - {email}")
     
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+from app.schemas.common import APIResponse
+from app.core.database import engine, async_engine, pool_status
+from app.core.replicas import replica_pool
+from app.core.security import password_hasher
+from app.dependencies import RoleChecker
+from app.core.logger import get_logger
+
+router = APIRouter(prefix="/api/internal", tags=["internal"], dependencies=[Depends(RoleChecker(["admin"]))])
+logger = get_logger(__name__)
+
+
+@router.get("/db-pool", response_model=APIResponse[dict])
+async def get_db_pool_stats():
+    # Per worker process: each uvicorn worker owns its own pools
+    return APIResponse[dict](
+        success=True,
+        data={
+            "async": pool_status(async_engine.pool),
+            "sync": pool_status(engine.pool),
+            "replicas": replica_pool.status(),
+        }
+    )
+
+
+@router.get("/password-hashing", response_model=APIResponse[dict])
+async def get_password_hashing_stats():
+    return APIResponse[dict](success=True, data=password_hasher.stats())
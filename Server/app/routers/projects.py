@@ -1,14 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.common import APIResponse
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.replicas import get_read_db
 from app.models.task import Task
 from app.models.project import Project
 from app.dependencies import get_current_user, RoleChecker
-from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate, ProjectListResponse, ProjectDetailResponse, ProjectWithTaskCount
+from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate, ProjectListResponse, ProjectDetailResponse
 from app.core.logger import get_logger
-from typing import List, Optional
+from app.core.pagination import paginate
+from app.core.serialization import rows_to_dicts, dump_api_response
+from app.services.read_queries import (
+    PROJECT_FIELDS, select_projects, select_tasks, get_project_row, status_counts
+)
+from app.core.response_cache import (
+    response_cache, cached_response, task_write_tags, project_tag, PUBLIC, PROJECTS_TAG, PROJECT_DELETIONS_TAG
+)
+from app.services.search_service import apply_search
+from app.services.export_service import export_response
+from app.schemas.task import TaskListResponse, TaskResponse
+from app.routers.task import cached_task_list
+from typing import Optional
 import math
 
 router = APIRouter(prefix="/api/project", tags=["projects"])
@@ -16,11 +29,11 @@ logger = get_logger(__name__)
 
 
 @router.post("/", response_model=ProjectResponse)
-def create_project(
+async def create_project(
     project: ProjectCreate,
     current_user=Depends(get_current_user),
     admin_check=Depends(RoleChecker(["admin"])),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     logger.info(f"User {current_user.id} is creating project: {project.title}")
     
@@ -31,113 +44,151 @@ def create_project(
     )
 
     db.add(new_project)
-    db.commit()
-    db.refresh(new_project)
+    await db.commit()
+    await db.refresh(new_project)
+    # Drops any cached 404 for the new id
+    await response_cache.invalidate(PROJECTS_TAG, project_tag(new_project.id))
     
     logger.info(f"Project created successfully with ID: {new_project.id}")
     return new_project
 
 
 @router.get("/", response_model=APIResponse[ProjectListResponse], response_model_exclude_none=True)
-def list_projects(
+async def list_projects(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     search: Optional[str] = Query(None),
     created_by: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     logger.info(f"User {current_user.id} fetching projects - page: {page}, size: {size}, search: {search}, created_by: {created_by}")
     
-    query = db.query(
-        Project,
-        func.count(Task.id).label('task_count')
-    ).outerjoin(Task, Project.id == Task.project_id)
+    async def build():
+        # Task counts are stored on the project row, so this stays a scan of projects
+        query = select_projects()
+        
+        rank = None
+        if search:
+            query, rank = apply_search(query, Project, search, db.bind.dialect.name)
+        
+        if created_by:
+            query = query.where(Project.created_by == created_by)
+        
+        if rank is not None:
+            query = query.order_by(rank.desc(), Project.id.desc())
+        else:
+            # OFFSET pages need a total order, or rows can repeat or go missing between pages
+            query = query.order_by(Project.id.desc())
+        
+        projects, total = await paginate(db, query, page, size)
+        total_pages = math.ceil(total / size)
+        
+        logger.info(f"Retrieved {len(projects)} projects out of {total} total")
+        
+        return dump_api_response({
+            "projects": rows_to_dicts(projects, PROJECT_FIELDS),
+            "total": total,
+            "page": page,
+            "size": size,
+            "total_pages": total_pages
+        })
+    
+    return await cached_response(request, [PROJECTS_TAG], PUBLIC, build)
+
+
+@router.get("/export")
+async def export_projects(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    search: Optional[str] = Query(None),
+    created_by: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user)
+):
+    logger.info(f"User {current_user.id} exporting projects as {export_format} - search: {search}, created_by: {created_by}")
+    
+    query = select(
+        Project.id, Project.title, Project.description, Project.created_by,
+        Project.created_at, Project.updated_at, Project.task_count
+    )
     
     if search:
-        query = query.filter(
-            (Project.title.ilike(f"%{search}%")) | 
-            (Project.description.ilike(f"%{search}%"))
-        )
+        query, _ = apply_search(query, Project, search, db.bind.dialect.name)
     
     if created_by:
-        query = query.filter(Project.created_by == created_by)
-    
-    query = query.group_by(Project.id)
-    
-    total = query.count()
-    total_pages = math.ceil(total / size)
-    
-    projects_with_count = query.offset((page - 1) * size).limit(size).all()
+        query = query.where(Project.created_by == created_by)
     
-    projects_list = []
-    for project, task_count in projects_with_count:
-        project_dict = {
-            "id": project.id,
-            "title": project.title,
-            "description": project.description,
-            "created_by": project.created_by,
-            "created_at": project.created_at,
-            "updated_at": project.updated_at,
-            "task_count": task_count
-        }
-        projects_list.append(ProjectWithTaskCount(**project_dict))
-    
-    logger.info(f"Retrieved {len(projects_list)} projects out of {total} total")
-    
-    return APIResponse[ProjectListResponse](
-        success=True,
-        data=ProjectListResponse(
-            projects=projects_list,
-            total=total,
-            page=page,
-            size=size,
-            total_pages=total_pages
-        )
-    )
+    return export_response(query.order_by(Project.id), export_format, "projects")
 
 
-#get project by id with its tasks
+#get project by id with task counts per status
 @router.get("/{project_id}", response_model=APIResponse[ProjectDetailResponse], response_model_exclude_none=True)
-def get_project(
+async def get_project(
     project_id: int,
+    request: Request,
+    include_tasks: bool = Query(False, description="Embed every task of the project; prefer /{project_id}/tasks for large projects"),
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    logger.info(f"User {current_user.id} fetching project with ID: {project_id}")
-    
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        logger.warning(f"Project with ID {project_id} not found")
-        raise HTTPException(status_code=404, detail="Project not found")
+    logger.info(f"User {current_user.id} fetching project with ID: {project_id}, include_tasks: {include_tasks}")
+    
+    async def build():
+        project = await get_project_row(db, project_id)
+        if not project:
+            logger.warning(f"Project with ID {project_id} not found")
+            raise HTTPException(status_code=404, detail="Project not found")
+        
+        tasks = None
+        if include_tasks:
+            rows = (await db.execute(select_tasks().where(Task.project_id == project_id))).all()
+            tasks = [TaskResponse.model_validate(row) for row in rows]
+        
+        project_detail = ProjectDetailResponse(
+            **{field: getattr(project, field) for field in PROJECT_FIELDS},
+            status_counts=status_counts(project),
+            tasks=tasks
+        )
+        
+        logger.info(f"Project {project_id} retrieved with {project_detail.task_count} tasks")
+        
+        return APIResponse[ProjectDetailResponse](success=True, data=project_detail)
     
-    tasks = db.query(Task).filter(Task.project_id == project_id).all()
+    return await cached_response(request, [project_tag(project_id)], PUBLIC, build)
+
+
+@router.get("/{project_id}/tasks", response_model=APIResponse[TaskListResponse], response_model_exclude_none=True)
+async def list_project_tasks(
+    project_id: int,
+    request: Request,
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1, le=100),
+    search: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    assigned_to: Optional[int] = Query(None),
+    after: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor; switches to keyset pagination"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user)
+):
+    logger.info(f"User {current_user.id} fetching tasks of project {project_id} - page: {page}, size: {size}, search: {search}, status: {status}, assigned_to: {assigned_to}, after: {after}")
     
-    project_detail = ProjectDetailResponse(
-        id=project.id,
-        title=project.title,
-        description=project.description,
-        created_by=project.created_by,
-        created_at=project.created_at,
-        updated_at=project.updated_at,
-        tasks=tasks
+    # Same listing, filters, pagination and caching as /api/task/, scoped to
+    # the project; a missing project's 404 is cached under its tag too
+    return await cached_task_list(
+        request, db, page, size, search, status, project_id, assigned_to, after, require_project=True
     )
-    
-    logger.info(f"Project {project_id} retrieved with {len(tasks)} tasks")
-    
-    return APIResponse[ProjectDetailResponse](success=True, data=project_detail)
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse, dependencies=[Depends(RoleChecker(["admin"]))])
-def update_project(
+async def update_project(
     project_id: int,
     project_update: ProjectUpdate,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     logger.info(f"User {current_user.id} attempting to update project {project_id}")
     
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         logger.warning(f"Project with ID {project_id} not found for update")
         raise HTTPException(status_code=404, detail="Project not found")
@@ -146,27 +197,32 @@ def update_project(
         if value is not None:
             setattr(project, var, value)
 
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await db.refresh(project)
+    await response_cache.invalidate(PROJECTS_TAG, project_tag(project_id))
     
     logger.info(f"Project {project_id} updated successfully")
     return project
 
 @router.delete("/{project_id}", response_model=APIResponse[None], dependencies=[Depends(RoleChecker(["admin"]))])
-def delete_project(
+async def delete_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
     logger.info(f"User {current_user.id} attempting to delete project {project_id}")
     
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         logger.warning(f"Project with ID {project_id} not found for deletion")
         raise HTTPException(status_code=404, detail="Project not found")
 
-    db.delete(project)
-    db.commit()
+    # Delete with statements rather than session.delete(), which would lazy
+    # load every task of the project to cascade the delete in Python
+    await db.execute(delete(Task).where(Task.project_id == project_id))
+    await db.execute(delete(Project).where(Project.id == project_id))
+    await db.commit()
+    await response_cache.invalidate(*task_write_tags([project_id]), PROJECT_DELETIONS_TAG)
     
     logger.info(f"Project {project_id} deleted successfully")
     return APIResponse[None](success=True, data=None, message="Project deleted successfully")
\ No newline at end of file
@@ -1,38 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile, File
+from sqlalchemy import select, insert, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from app.schemas.common import APIResponse
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.replicas import get_read_db
 from app.models.task import Task
 from app.models.user import User
 from app.models.project import Project
 from app.dependencies import get_current_user, RoleChecker
-from app.services.email_service import EmailService
-from app.core.socket import sio
-from app.schemas.task import TaskCreate, TaskResponse, TaskUpdate, TaskListResponse
+from app.services import outbox
+from app.services.search_service import apply_search
+from app.services.export_service import export_response
+from app.services.import_service import TaskImporter, format_from_filename, parse_records
+from app.core.config import settings
+from app.core.response_cache import (
+    response_cache, cached_response, task_write_tags, project_tag, task_tag, visibility,
+    PUBLIC, TASKS_TAG, PROJECT_DELETIONS_TAG
+)
+from app.core.socket import task_rooms, project_room, user_room
+from app.schemas.task import (
+    TaskCreate, TaskResponse, TaskUpdate, TaskListResponse,
+    TaskBulkCreate, TaskBulkUpdate, TaskBulkDelete, TaskBulkItemResult, TaskBulkResponse,
+    TaskImportResponse
+)
 from app.core.logger import get_logger
-from typing import List, Optional
+from app.core.pagination import paginate, keyset_paginate, encode_cursor
+from app.core.serialization import rows_to_dicts, dump_api_response, json_response
+from app.services.read_queries import TASK_FIELDS, select_tasks, get_task_row, project_exists
+from typing import Optional
+from collections import defaultdict
+import io
 import math
-from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-
-
-TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
-
-# Setup Jinja2 environment
-env = Environment(
-    loader=FileSystemLoader(searchpath=str(TEMPLATES_DIR)),
-    autoescape=select_autoescape(['html', 'xml'])
-)
 
 
 router = APIRouter(prefix="/api/task", tags=["tasks"])
 logger = get_logger(__name__)
+
+# Newest first; the primary key is monotonic with creation time, so a cursor
+# is a single indexed value and every seek costs the same.
+TASK_SORT_KEY = (Task.id,)
+
 @router.post("/", response_model=TaskResponse)
 async def create_task(
     task: TaskCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
     logger.info(f"User {current_user.id} creating task: {task.title} for project {task.project_id}")
@@ -44,17 +56,18 @@ async def create_task(
         assigned_to=task.assigned_to,
         due_date=task.due_date,
     )
-    user = db.query(User).filter(User.id == task.assigned_to).first()
+    user = await db.get(User, task.assigned_to)
     if not user:
         logger.warning(f"User with ID {task.assigned_to} not found for task assignment")
         raise HTTPException(status_code=404, detail="Assigned user not found")
 
     db.add(new_task)
-    db.commit()
-    db.refresh(new_task)
+    await db.flush()
+    await db.refresh(new_task)
 
-    # Emit socket event to notify all connected clients about the new task
-    await sio.emit('task_created', {
+    # Notifications are committed with the task and delivered by the outbox relay,
+    # to the project's viewers and the assignee
+    outbox.add_socket_event(db, 'task_created', {
         'task_id': new_task.id,
         'title': new_task.title,
         'description': new_task.description,
@@ -64,161 +77,478 @@ async def create_task(
         'due_date': new_task.due_date.isoformat() if new_task.due_date else None,
         'created_at': new_task.created_at.isoformat(),
         'updated_at': new_task.updated_at.isoformat()
-    })
-
-    logger.info(f"Task {new_task.id} created and assigned to user {user.id}")
+    }, rooms=task_rooms(new_task), key=new_task.id)
 
     # Send task assignment email
-    template = env.get_template('task-assigned.html')
-    html = template.render(
-        user_name=user.first_name,
-        task_name=new_task.title
-    )
-    task = EmailService.send_email.delay(
+    outbox.add_email(
+        db,
         to_email=user.email,
         subject="New Task Assigned",
-        html_content=html
+        template_name='task-assigned.html',
+        context={"user_name": user.first_name, "task_name": new_task.title}
     )
+    await db.commit()
+    outbox.notify()
+    await response_cache.invalidate(*task_write_tags([new_task.project_id]))
+
+    logger.info(f"Task {new_task.id} created and assigned to user {user.id}")
     return new_task
 
 
+def _task_event_data(task: Task) -> dict:
+    return {
+        'task_id': task.id,
+        'title': task.title,
+        'description': task.description,
+        'project_id': task.project_id,
+        'assigned_to': task.assigned_to,
+        'status': task.status,
+        'due_date': task.due_date.isoformat() if task.due_date else None,
+        'created_at': task.created_at.isoformat(),
+        'updated_at': task.updated_at.isoformat()
+    }
+
+
+def _stage_project_events(db: AsyncSession, event: str, field: str, grouped: dict):
+    # One aggregated event per project instead of one per task
+    for project_id, (items, rooms) in grouped.items():
+        outbox.add_socket_event(
+            db, event, {'project_id': project_id, field: items},
+            rooms=sorted(rooms | {project_room(project_id)})
+        )
+
+
+def _bulk_response(results: list[TaskBulkItemResult], action: str) -> APIResponse[TaskBulkResponse]:
+    succeeded = sum(1 for result in results if result.success)
+    return APIResponse[TaskBulkResponse](
+        success=True,
+        data=TaskBulkResponse(succeeded=succeeded, failed=len(results) - succeeded, results=results),
+        message=f"{succeeded} of {len(results)} tasks {action}"
+    )
+
+
+@router.post("/bulk", response_model=APIResponse[TaskBulkResponse], response_model_exclude_none=True)
+async def bulk_create_tasks(
+    payload: TaskBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user)
+):
+    items = payload.tasks
+    logger.info(f"User {current_user.id} bulk creating {len(items)} tasks")
+
+    # Validate every assignee and project with one IN query each
+    assignees = {
+        row.id: row for row in
+        (await db.execute(select(User.id, User.email, User.first_name).where(User.id.in_({item.assigned_to for item in items})))).all()
+    }
+    project_ids = set((await db.scalars(select(Project.id).where(Project.id.in_({item.project_id for item in items})))).all())
+
+    results: list[Optional[TaskBulkItemResult]] = [None] * len(items)
+    rows, row_indexes = [], []
+    for index, item in enumerate(items):
+        if item.assigned_to not in assignees:
+            results[index] = TaskBulkItemResult(index=index, success=False, error="Assigned user not found")
+        elif item.project_id not in project_ids:
+            results[index] = TaskBulkItemResult(index=index, success=False, error="Project not found")
+        else:
+            rows.append(item.model_dump())
+            row_indexes.append(index)
+
+    if rows:
+        # executemany in a single statement batch; RETURNING brings back ids and server defaults
+        created = (await db.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows)).all()
+
+        grouped = defaultdict(lambda: ([], set()))
+        for index, new_task in zip(row_indexes, created):
+            results[index] = TaskBulkItemResult(index=index, success=True, id=new_task.id, task=TaskResponse.model_validate(new_task))
+            items_for_project, rooms = grouped[new_task.project_id]
+            items_for_project.append(_task_event_data(new_task))
+            rooms.add(user_room(new_task.assigned_to))
+
+            assignee = assignees[new_task.assigned_to]
+            outbox.add_email(
+                db,
+                to_email=assignee.email,
+                subject="New Task Assigned",
+                template_name='task-assigned.html',
+                context={"user_name": assignee.first_name, "task_name": new_task.title}
+            )
+        _stage_project_events(db, 'tasks_created', 'tasks', grouped)
+        await db.commit()
+        outbox.notify()
+        await response_cache.invalidate(*task_write_tags(grouped))
+
+    logger.info(f"Bulk create by user {current_user.id}: {len(rows)} of {len(items)} tasks created")
+    return _bulk_response(results, "created")
+
+
+@router.patch("/bulk", response_model=APIResponse[TaskBulkResponse], response_model_exclude_none=True)
+async def bulk_update_tasks(
+    payload: TaskBulkUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user)
+):
+    items = payload.tasks
+    logger.info(f"User {current_user.id} bulk updating {len(items)} tasks")
+
+    tasks = {task.id: task for task in (await db.scalars(select(Task).where(Task.id.in_({item.id for item in items})))).all()}
+    new_assignees = {item.assigned_to for item in items if item.assigned_to is not None}
+    valid_assignees = set((await db.scalars(select(User.id).where(User.id.in_(new_assignees)))).all()) if new_assignees else set()
+    new_projects = {item.project_id for item in items if item.project_id is not None}
+    valid_projects = set((await db.scalars(select(Project.id).where(Project.id.in_(new_projects)))).all()) if new_projects else set()
+
+    results: list[Optional[TaskBulkItemResult]] = [None] * len(items)
+    params, updated_indexes, seen = [], {}, set()
+    old_state = {}
+    for index, item in enumerate(items):
+        task = tasks.get(item.id)
+        if task is None:
+            results[index] = TaskBulkItemResult(index=index, success=False, id=item.id, error="Task not found")
+        elif item.id in seen:
+            results[index] = TaskBulkItemResult(index=index, success=False, id=item.id, error="Duplicate task id in request")
+        elif item.assigned_to is not None and item.assigned_to not in valid_assignees:
+            results[index] = TaskBulkItemResult(index=index, success=False, id=item.id, error="Assigned user not found")
+        elif item.project_id is not None and item.project_id not in valid_projects:
+            results[index] = TaskBulkItemResult(index=index, success=False, id=item.id, error="Project not found")
+        else:
+            seen.add(item.id)
+            updated_indexes[item.id] = index
+            # Same rule as PATCH /{task_id}: omitted and null fields are left unchanged
+            values = item.model_dump(exclude={"id"}, exclude_none=True)
+            if values:
+                old_state[item.id] = (task.status, set(task_rooms(task)), task.project_id)
+                params.append({"id": item.id, **values})
+
+    if params:
+        # ORM bulk UPDATE by primary key: executemany in one transaction
+        await db.execute(update(Task), params)
+
+    updated = {}
+    if updated_indexes:
+        updated = {
+            task.id: task for task in
+            (await db.scalars(select(Task).where(Task.id.in_(updated_indexes)).execution_options(populate_existing=True))).all()
+        }
+    for task_id, index in updated_indexes.items():
+        results[index] = TaskBulkItemResult(index=index, success=True, id=task_id, task=TaskResponse.model_validate(updated[task_id]))
+
+    if params:
+        status_changed = [
+            updated[task_id] for task_id, (old_status, _, _) in old_state.items()
+            if updated[task_id].status != old_status
+        ]
+        creators = {}
+        if status_changed:
+            creators = {
+                row.id: row for row in (await db.execute(
+                    select(Project.id, User.email, User.first_name)
+                    .join(User, User.id == Project.created_by)
+                    .where(Project.id.in_({task.project_id for task in status_changed}))
+                )).all()
+            }
+        timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+        for task in status_changed:
+            creator = creators.get(task.project_id)
+            if creator:
+                outbox.add_email(
+                    db,
+                    to_email=creator.email,
+                    subject="Task Status Updated",
+                    template_name='task-status-update.html',
+                    context={
+                        "user_name": creator.first_name,
+                        "task_name": task.title,
+                        "previous_status": old_state[task.id][0],
+                        "new_status": task.status,
+                        "task_id": task.id,
+                        "timestamp": timestamp
+                    }
+                )
+
+        grouped = defaultdict(lambda: ([], set()))
+        for task_id, (_, old_rooms, _) in old_state.items():
+            task = updated[task_id]
+            items_for_project, rooms = grouped[task.project_id]
+            items_for_project.append(_task_event_data(task))
+            # A reassigned or moved task is announced to its old rooms too
+            rooms.update(old_rooms, task_rooms(task))
+        _stage_project_events(db, 'tasks_updated', 'tasks', grouped)
+        await db.commit()
+        outbox.notify()
+        # Moved tasks leave their old project's lists as well
+        old_projects = {old_project_id for _, _, old_project_id in old_state.values()}
+        await response_cache.invalidate(*task_write_tags(old_projects | set(grouped), old_state))
+
+    logger.info(f"Bulk update by user {current_user.id}: {len(updated_indexes)} of {len(items)} tasks updated")
+    return _bulk_response(results, "updated")
+
+
+@router.post("/bulk/delete", response_model=APIResponse[TaskBulkResponse], response_model_exclude_none=True)
+async def bulk_delete_tasks(
+    payload: TaskBulkDelete,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user)
+):
+    logger.info(f"User {current_user.id} bulk deleting {len(payload.ids)} tasks")
+
+    tasks = {
+        row.id: row for row in
+        (await db.execute(select(Task.id, Task.project_id, Task.assigned_to).where(Task.id.in_(payload.ids)))).all()
+    }
+
+    results = []
+    deletable = set()
+    grouped = defaultdict(lambda: ([], set()))
+    for index, task_id in enumerate(payload.ids):
+        task = tasks.get(task_id)
+        if task is None:
+            results.append(TaskBulkItemResult(index=index, success=False, id=task_id, error="Task not found"))
+        elif task_id in deletable:
+            results.append(TaskBulkItemResult(index=index, success=False, id=task_id, error="Duplicate task id in request"))
+        elif task.assigned_to != current_user.id and current_user.role != "admin":
+            results.append(TaskBulkItemResult(index=index, success=False, id=task_id, error="Not authorized to delete this task"))
+        else:
+            deletable.add(task_id)
+            results.append(TaskBulkItemResult(index=index, success=True, id=task_id))
+            task_ids, rooms = grouped[task.project_id]
+            task_ids.append(task_id)
+            rooms.add(user_room(task.assigned_to))
+
+    if deletable:
+        await db.execute(delete(Task).where(Task.id.in_(list(deletable))))
+        _stage_project_events(db, 'tasks_deleted', 'task_ids', grouped)
+        await db.commit()
+        outbox.notify()
+        await response_cache.invalidate(*task_write_tags(grouped, deletable))
+
+    logger.info(f"Bulk delete by user {current_user.id}: {len(deletable)} of {len(payload.ids)} tasks deleted")
+    return _bulk_response(results, "deleted")
+
+
+@router.post("/import", response_model=APIResponse[TaskImportResponse], response_model_exclude_none=True, dependencies=[Depends(RoleChecker(["admin"]))])
+async def import_tasks(
+    file: UploadFile = File(...),
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    batch_size: Optional[int] = Query(None, ge=1, le=10000),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user)
+):
+    import_format = import_format or format_from_filename(file.filename)
+    if import_format is None:
+        logger.warning(f"Task import by user {current_user.id} rejected: unknown format for {file.filename}")
+        raise HTTPException(status_code=400, detail="Unknown file format. Pass format=csv or format=ndjson")
+
+    logger.info(f"User {current_user.id} importing tasks from {file.filename} as {import_format}")
+
+    # The upload is spooled to disk by the server; read it back line by line
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    importer = TaskImporter(db, batch_size=batch_size or settings.IMPORT_BATCH_SIZE)
+    try:
+        summary = await importer.run(parse_records(lines, import_format))
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File must be UTF-8 encoded")
+    finally:
+        lines.detach()
+        # Batches committed before a failure are visible too
+        await response_cache.invalidate(*task_write_tags(importer.project_ids))
+
+    return APIResponse[TaskImportResponse](
+        success=True,
+        data=summary,
+        message=f"{summary.imported} of {summary.processed} tasks imported"
+    )
+
+
 @router.get("/assigned", response_model=APIResponse[TaskListResponse], response_model_exclude_none=True)
-def get_assigned_tasks(
+async def get_assigned_tasks(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     status: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    after: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor; switches to keyset pagination"),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
-    logger.info(f"User {current_user.id} fetching their assigned tasks - page: {page}, size: {size}, status: {status}")
+    logger.info(f"User {current_user.id} fetching their assigned tasks - page: {page}, size: {size}, status: {status}, after: {after}")
     
-    query = db.query(Task).filter(Task.assigned_to == current_user.id)
+    query = select_tasks().where(Task.assigned_to == current_user.id)
     
     if status:
-        query = query.filter(Task.status == status)
-    
-    total = query.count()
-    total_pages = math.ceil(total / size)
+        query = query.where(Task.status == status)
     
-    tasks = query.offset((page - 1) * size).limit(size).all()
-    
-    logger.info(f"Retrieved {len(tasks)} assigned tasks out of {total} total for user {current_user.id}")
-    
-    return APIResponse[TaskListResponse](
-        success=True,
-        data=TaskListResponse(
-            tasks=tasks,
-            total=total,
-            page=page,
-            size=size,
-            total_pages=total_pages
-        )
-    )
-
+    return json_response(await _paginate_tasks(db, query, page, size, after))
 
 
+@router.get("/export")
+async def export_tasks(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    search: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    project_id: Optional[int] = Query(None),
+    assigned_to: Optional[int] = Query(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(get_current_user)
+):
+    logger.info(f"User {current_user.id} exporting tasks as {export_format} - search: {search}, status: {status}, project_id: {project_id}, assigned_to: {assigned_to}")
+    
+    query = select(
+        Task.id, Task.project_id, Task.title, Task.description, Task.assigned_to,
+        Task.status, Task.due_date, Task.created_at, Task.updated_at
+    )
+    query, _ = _filter_tasks(query, db, search, status, project_id, assigned_to)
+    
+    # Plain id order so rows stream straight off the primary key index
+    return export_response(query.order_by(Task.id), export_format, "tasks")
 
 
 @router.get("/", response_model=APIResponse[TaskListResponse], response_model_exclude_none=True)
-def list_tasks(
+async def list_tasks(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     search: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     project_id: Optional[int] = Query(None),
     assigned_to: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    after: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor; switches to keyset pagination"),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
-    logger.info(f"User {current_user.id} fetching tasks - page: {page}, size: {size}, search: {search}, status: {status}, project_id: {project_id}, assigned_to: {assigned_to}")
+    logger.info(f"User {current_user.id} fetching tasks - page: {page}, size: {size}, search: {search}, status: {status}, project_id: {project_id}, assigned_to: {assigned_to}, after: {after}")
+    
+    return await cached_task_list(request, db, page, size, search, status, project_id, assigned_to, after)
+
+
+async def cached_task_list(
+    request: Request, db: AsyncSession, page: int, size: int, search, status, project_id, assigned_to, after,
+    require_project: bool = False
+):
+    """
+    The cached task list shared by /api/task/ and /api/project/{id}/tasks.
+    With `require_project` a missing project is a 404, checked on a cache
+    miss and cached like the list itself.
+    """
+    async def build():
+        if require_project and not await project_exists(db, project_id):
+            logger.warning(f"Project with ID {project_id} not found")
+            raise HTTPException(status_code=404, detail="Project not found")
+        query, rank = _filter_tasks(select_tasks(), db, search, status, project_id, assigned_to)
+        return await _paginate_tasks(db, query, page, size, after, rank)
     
-    query = db.query(Task)
+    # Every caller sees the same tasks; a project filter only depends on that project
+    tags = [project_tag(project_id)] if project_id else [TASKS_TAG]
+    return await cached_response(request, tags, PUBLIC, build, cache_errors=(404,) if require_project else ())
+
+
+def _filter_tasks(query, db: AsyncSession, search, status, project_id, assigned_to):
+    """Filters shared by the task list and export endpoints"""
+    rank = None
     
     if search:
-        query = query.filter(
-            (Task.title.ilike(f"%{search}%")) |
-            (Task.description.ilike(f"%{search}%"))
-        )
+        query, rank = apply_search(query, Task, search, db.bind.dialect.name)
     
     if status:
-        query = query.filter(Task.status == status)
+        query = query.where(Task.status == status)
     
     if project_id:
-        query = query.filter(Task.project_id == project_id)
+        query = query.where(Task.project_id == project_id)
     
     if assigned_to:
-        query = query.filter(Task.assigned_to == assigned_to)
+        query = query.where(Task.assigned_to == assigned_to)
     
-    total = query.count()
+    return query, rank
+
+
+async def _paginate_tasks(db: AsyncSession, query, page: int, size: int, after: Optional[str], rank=None) -> bytes:
+    """One page of `query` (from select_tasks) as an encoded APIResponse[TaskListResponse]"""
+    # Cursor mode: seek past the last seen id and skip the count entirely
+    if after:
+        rows, next_cursor = await keyset_paginate(db, query, TASK_SORT_KEY, size, after)
+        logger.info(f"Retrieved {len(rows)} tasks after cursor")
+        return dump_api_response({
+            "tasks": rows_to_dicts(rows, TASK_FIELDS),
+            "size": size,
+            "next_cursor": next_cursor
+        })
+
+    # Search results are ordered by relevance first; cursor mode keeps plain id order
+    order_by = [column.desc() for column in TASK_SORT_KEY]
+    if rank is not None:
+        order_by.insert(0, rank.desc())
+    rows, total = await paginate(db, query.order_by(*order_by), page, size)
     total_pages = math.ceil(total / size)
-    
-    tasks = query.offset((page - 1) * size).limit(size).all()
+    tasks = rows_to_dicts(rows, TASK_FIELDS)
+    # The cursor seeks by id, so it can only continue an id-ordered page;
+    # relevance-ranked search results are paged with page numbers only
+    next_cursor = None
+    if tasks and page < total_pages and rank is None:
+        next_cursor = encode_cursor([tasks[-1][column.key] for column in TASK_SORT_KEY])
     
     logger.info(f"Retrieved {len(tasks)} tasks out of {total} total")
     
-    return APIResponse[TaskListResponse](
-        success=True,
-        data=TaskListResponse(
-            tasks=tasks,
-            total=total,
-            page=page,
-            size=size,
-            total_pages=total_pages
-        )
-    )
-
-
-
+    return dump_api_response({
+        "tasks": tasks,
+        "total": total,
+        "page": page,
+        "size": size,
+        "total_pages": total_pages,
+        "next_cursor": next_cursor
+    })
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-def get_task(
+async def get_task(
     task_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(get_current_user)
 ):
     logger.info(f"User {current_user.id} fetching task with ID: {task_id}")
     
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        logger.warning(f"Task with ID {task_id} not found")
-        raise HTTPException(status_code=404, detail="Task not found")
-    if(task.assigned_to != current_user.id and current_user.role != "admin"):
-        logger.warning(f"User {current_user.id} unauthorized to access task {task_id}")
-        raise HTTPException(status_code=403, detail="Not authorized to access this task")
-
-    logger.info(f"Task {task_id} retrieved successfully")
-    return task
-
+    async def build():
+        task = await get_task_row(db, task_id)
+        if not task:
+            logger.warning(f"Task with ID {task_id} not found")
+            raise HTTPException(status_code=404, detail="Task not found")
+        if(task.assigned_to != current_user.id and current_user.role != "admin"):
+            logger.warning(f"User {current_user.id} unauthorized to access task {task_id}")
+            raise HTTPException(status_code=403, detail="Not authorized to access this task")
 
+        logger.info(f"Task {task_id} retrieved successfully")
+        return TaskResponse.model_validate(task)
 
+    # Only the assignee and admins may read a task, so entries are per caller
+    tags = [task_tag(task_id), PROJECT_DELETIONS_TAG]
+    return await cached_response(request, tags, visibility(current_user), build, exclude_none=False)
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: int,
     task_update: TaskUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
     logger.info(f"User {current_user.id} attempting to update task {task_id}")
     
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         logger.warning(f"Task with ID {task_id} not found for update")
         raise HTTPException(status_code=404, detail="Task not found")
 
     old_status = task.status
+    old_project_id = task.project_id
+    # A reassigned or moved task is announced to its old rooms too
+    old_rooms = task_rooms(task)
     
     for var, value in vars(task_update).items():
         if value is not None:
             setattr(task, var, value)
 
-    db.commit()
-    db.refresh(task)
+    await db.flush()
+    await db.refresh(task)
 
-    # Emit socket event to notify all connected clients about the task update
-    await sio.emit('task_updated', {
+    # Committed with the update; the relay coalesces repeated updates of a task
+    outbox.add_socket_event(db, 'task_updated', {
         'task_id': task.id,
         'title': task.title,
         'description': task.description,
@@ -227,29 +557,29 @@ async def update_task(
         'status': task.status,
         'due_date': task.due_date.isoformat() if task.due_date else None,
         'updated_at': task.updated_at.isoformat()
-    })
+    }, rooms=old_rooms + task_rooms(task), key=task.id)
 
     timestamp = datetime.now().strftime("%B %d, %Y at %I:%M %p")
 
     if task_update.status and task_update.status != old_status:
         logger.info(f"Task {task_id} status changed from {old_status} to {task_update.status}")
-        project = db.query(Project).filter(Project.id == task.project_id).first()
+        project = await db.get(Project, task.project_id)
         if project:
-            user = db.query(User).filter(User.id == project.created_by).first()
+            user = await db.get(User, project.created_by)
             if user:
-                template = env.get_template('task-status-update.html')
-                html = template.render(
-                    user_name=user.first_name,
-                    task_name=task.title,
-                    previous_status=old_status,
-                    new_status=task_update.status,
-                    task_id=task.id,
-                    timestamp=timestamp
-                )
-                email_task = EmailService.send_email.delay(
+                outbox.add_email(
+                    db,
                     to_email=user.email,
                     subject="Task Status Updated",
-                    html_content=html
+                    template_name='task-status-update.html',
+                    context={
+                        "user_name": user.first_name,
+                        "task_name": task.title,
+                        "previous_status": old_status,
+                        "new_status": task_update.status,
+                        "task_id": task.id,
+                        "timestamp": timestamp
+                    }
                 )
                 logger.info(f"Email notification queued for project creator {user.email}")
             else:
@@ -257,20 +587,23 @@ async def update_task(
         else:
             logger.warning(f"Project not found for task {task_id}")
 
+    await db.commit()
+    outbox.notify()
+    await response_cache.invalidate(*task_write_tags({old_project_id, task.project_id}, [task.id]))
+
     logger.info(f"Task {task_id} updated successfully")
     return task
 
 
-
 @router.delete("/{task_id}", response_model=APIResponse[None], response_model_exclude_none=True)
-def delete_task(
+async def delete_task(
     task_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
     logger.info(f"User {current_user.id} attempting to delete task {task_id}")
     
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = await db.get(Task, task_id)
     if not task:
         logger.warning(f"Task with ID {task_id} not found for deletion")
         raise HTTPException(status_code=404, detail="Task not found")
@@ -279,8 +612,9 @@ def delete_task(
         logger.warning(f"User {current_user.id} unauthorized to delete task {task_id}")
         raise HTTPException(status_code=403, detail="Not authorized to delete this task")
 
-    db.delete(task)
-    db.commit()
+    await db.delete(task)
+    await db.commit()
+    await response_cache.invalidate(*task_write_tags([task.project_id], [task_id]))
     
     logger.info(f"Task {task_id} deleted successfully")
     return APIResponse[None](success=True, data=None, message="Task deleted successfully")
\ No newline at end of file
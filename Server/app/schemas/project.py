@@ -47,5 +47,9 @@ class ProjectDetailResponse(BaseModel):
     created_by: int
     created_at: datetime
     updated_at: datetime
-    tasks: list[TaskResponse]
+    task_count: int
+    status_counts: dict[str, int]
+    # Only filled when the full list is requested with include_tasks=true;
+    # otherwise page through /api/project/{id}/tasks
+    tasks: Optional[list[TaskResponse]] = None
 
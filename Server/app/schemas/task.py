@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from typing import Optional
 from datetime import datetime
 
@@ -7,7 +7,13 @@ class TaskCreate(BaseModel):
     description: Optional[str] = None
     assigned_to: int
     project_id: int
-    due_date: Optional[str] = None
+    due_date: Optional[datetime] = None
+
+    @field_validator('due_date', mode='before')
+    @classmethod
+    def empty_due_date(cls, v):
+        # The client sends an empty string when no due date is picked
+        return v or None
 
 class TaskResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -32,10 +38,52 @@ class TaskUpdate(BaseModel):
 
 class TaskListResponse(BaseModel):
     tasks: list[TaskResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
-    
+# Upper bound on items per bulk request, to keep each transaction short
+BULK_TASK_LIMIT = 500
+
+class TaskBulkCreate(BaseModel):
+    tasks: list[TaskCreate] = Field(min_length=1, max_length=BULK_TASK_LIMIT)
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+class TaskBulkUpdate(BaseModel):
+    tasks: list[TaskBulkUpdateItem] = Field(min_length=1, max_length=BULK_TASK_LIMIT)
+
+class TaskBulkDelete(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=BULK_TASK_LIMIT)
+
+class TaskBulkItemResult(BaseModel):
+    index: int
+    success: bool
+    id: Optional[int] = None
+    task: Optional[TaskResponse] = None
+    error: Optional[str] = None
+
+class TaskBulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: list[TaskBulkItemResult]
+
+
+class TaskImportRow(TaskCreate):
+    """One record of a task import file; unknown columns are ignored"""
+    status: str = "todo"
+
+class TaskImportError(BaseModel):
+    line: int
+    error: str
+
+class TaskImportResponse(BaseModel):
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: list[TaskImportError] = []
+    errors_truncated: bool = False
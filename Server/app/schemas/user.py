@@ -53,3 +53,16 @@ class UserResponse(BaseModel):
     role: str
     created_at: datetime
 
+class UserDirectoryEntry(BaseModel):
+    # Just what an assignee picker shows
+    id: int
+    email: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    role: str
+
+class UserDirectoryResponse(BaseModel):
+    users: list[UserDirectoryEntry]
+    size: int
+    next_cursor: Optional[str] = None
+
@@ -1,8 +1,18 @@
+import asyncio
+import json
+import os
 import random
+import threading
+from typing import Optional
+from celery.signals import worker_init
 from app.core.celery_config import celery_app
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from app.core.config import settings
 from app.core.logger import get_logger
+from app.core.redis import get_redis, get_sync_redis
+from app.services.template_service import template_service
 
 logger = get_logger(__name__)
 
@@ -10,7 +20,172 @@ logger = get_logger(__name__)
 
 BREVO_API_KEY = settings.BREVO_API_KEY
 BREVO_SENDER_EMAIL = settings.BREVO_SENDER_EMAIL
-BREVO_API_URL = "https://api.brevo.com/v3/smtp/email"
+BREVO_API_URL = settings.BREVO_API_URL
+
+# Outgoing emails wait here until the next batch flush
+EMAIL_QUEUE_KEY = "email:outgoing"
+# Set while a flush is scheduled, so one window produces one Celery task;
+# expires on its own if that task is lost
+FLUSH_SCHEDULED_KEY = "email:flush-scheduled"
+FLUSH_SCHEDULED_TTL = 60
+# The batch being sent sits here until the provider accepted it; whatever a
+# crashed flush left behind is put back on the queue by the next one
+EMAIL_PROCESSING_KEY = "email:processing"
+# One flush at a time, so the processing list only ever holds one batch;
+# expires on its own if the worker holding it dies
+FLUSH_LOCK_KEY = "email:flush-lock"
+FLUSH_LOCK_TIMEOUT = 300
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+def create_http_session() -> requests.Session:
+    """
+    Keep-alive session for the email provider. Connection failures and
+    429/5xx rejections are retried with jittered exponential backoff; read
+    timeouts are not, since the provider may already have sent the email.
+    """
+    retry = Retry(
+        total=settings.EMAIL_HTTP_RETRIES,
+        connect=settings.EMAIL_HTTP_RETRIES,
+        read=0,
+        status=settings.EMAIL_HTTP_RETRIES,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        backoff_factor=0.5,
+        backoff_jitter=0.5,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.EMAIL_HTTP_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "api-key": BREVO_API_KEY or "",
+        "Content-Type": "application/json"
+    })
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """One session per worker process; sockets are never shared across a fork"""
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        with _session_lock:
+            if _session is None or _session_pid != os.getpid():
+                _session = create_http_session()
+                _session_pid = os.getpid()
+    return _session
+
+
+def retry_countdown(retries: int) -> float:
+    # Full jitter, so emails that failed together don't retry together
+    return random.uniform(1, 2 ** (retries + 1))
+
+
+@worker_init.connect
+def precompile_templates(**kwargs):
+    # Compiled before the pool starts, so forked workers inherit the templates
+    template_service.precompile()
+
+
+def _deliver(to_email: str, subject: str, html_content: str):
+    payload = {
+        "sender": {
+            "email": BREVO_SENDER_EMAIL,
+            "name": "Project Management <no-reply>"
+        },
+        "to": [{"email": to_email}],
+        "subject": subject,
+        "htmlContent": html_content
+    }
+    response = get_http_session().post(
+        BREVO_API_URL,
+        json=payload,
+        timeout=(settings.EMAIL_HTTP_CONNECT_TIMEOUT, settings.EMAIL_HTTP_READ_TIMEOUT)
+    )
+    response.raise_for_status()
+
+
+def _deliver_batch(messages: list[dict]):
+    """Send several rendered emails in one request using Brevo messageVersions"""
+    versions = [
+        {
+            "to": [{"email": message["to_email"]}],
+            "subject": message["subject"],
+            "htmlContent": message["html_content"]
+        }
+        for message in messages
+    ]
+    payload = {
+        "sender": {
+            "email": BREVO_SENDER_EMAIL,
+            "name": "Project Management <no-reply>"
+        },
+        # Base content is required; every version overrides it
+        "subject": messages[0]["subject"],
+        "htmlContent": messages[0]["html_content"],
+        "messageVersions": versions
+    }
+    response = get_http_session().post(
+        BREVO_API_URL,
+        json=payload,
+        timeout=(settings.EMAIL_HTTP_CONNECT_TIMEOUT, settings.EMAIL_HTTP_READ_TIMEOUT)
+    )
+    response.raise_for_status()
+
+
+def _requeue_processing(client):
+    """Put a batch left by a crashed flush back at the head of the queue, in order"""
+    while client.lmove(EMAIL_PROCESSING_KEY, EMAIL_QUEUE_KEY, "RIGHT", "LEFT") is not None:
+        pass
+
+
+def _flush_batches(client) -> int:
+    sent = 0
+    while True:
+        # Move the batch in one transaction, so every message is always on
+        # one of the two lists
+        with client.pipeline(transaction=True) as pipe:
+            for _ in range(settings.EMAIL_BATCH_MAX_SIZE):
+                pipe.lmove(EMAIL_QUEUE_KEY, EMAIL_PROCESSING_KEY, "LEFT", "RIGHT")
+            raw_messages = [raw for raw in pipe.execute() if raw is not None]
+        if not raw_messages:
+            break
+
+        try:
+            messages = []
+            for raw in raw_messages:
+                message = json.loads(raw)
+                try:
+                    message["html_content"] = template_service.render(message["template_name"], message["context"])
+                    messages.append(message)
+                except Exception as e:
+                    logger.error(f"Failed to render email {message['template_name']} for {message['to_email']}: {str(e)}")
+
+            if messages:
+                try:
+                    _deliver_batch(messages)
+                    sent += len(messages)
+                    logger.info(f"Email batch of {len(messages)} sent successfully")
+                except requests.RequestException as e:
+                    # One bad recipient fails the whole batch; retry each message on its own
+                    logger.error(f"Failed to send email batch of {len(messages)}, falling back to single sends: {str(e)}")
+                    for message in messages:
+                        EmailService.send_email.delay(
+                            to_email=message["to_email"],
+                            subject=message["subject"],
+                            html_content=message["html_content"]
+                        )
+        except Exception:
+            _requeue_processing(client)
+            raise
+        # Sent, handed to single-send tasks or unrenderable: the batch is done
+        client.delete(EMAIL_PROCESSING_KEY)
+    return sent
 
 
 class EmailService:
@@ -19,26 +194,81 @@ class EmailService:
     def send_email(self, to_email: str, subject: str, html_content: str):
         """Send email using Brevo API"""
         try:
-            headers = {
-                "api-key": BREVO_API_KEY,
-                "Content-Type": "application/json"
-            }
-            payload = {
-                "sender": {
-                    "email": BREVO_SENDER_EMAIL,
-                    "name": "Project Management <no-reply>"
-                },
-                "to": [{"email": to_email}],
-                "subject": subject,
-                "htmlContent": html_content
-            }
-            response = requests.post(BREVO_API_URL, json=payload, headers=headers)
-            response.raise_for_status()
+            _deliver(to_email, subject, html_content)
             logger.info(f"Email sent successfully to {to_email}")
         except requests.RequestException as e:
             logger.error(f"Failed to send email to {to_email}: {str(e)}")
-            raise self.retry(exc=e, countdown=2 ** self.request.retries)
+            raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
+
+    @celery_app.task(bind=True, max_retries=3, name="send_templated_email_task")
+    def send_templated_email(self, to_email: str, subject: str, template_name: str, context: dict):
+        """Render an email template in the worker and send it using Brevo API"""
+        html_content = template_service.render(template_name, context)
+        try:
+            _deliver(to_email, subject, html_content)
+            logger.info(f"Email {template_name} sent successfully to {to_email}")
+        except requests.RequestException as e:
+            logger.error(f"Failed to send email {template_name} to {to_email}: {str(e)}")
+            raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
         
+    @celery_app.task(name="flush_email_queue_task")
+    def flush_email_queue():
+        """
+        Drain the outgoing email queue in messageVersions batches. Each batch
+        is moved to a processing list and only removed from it once sent (or
+        handed to single-send tasks), so a crash never loses it.
+        """
+        client = get_sync_redis()
+        if client is None:
+            return 0
+        if not client.set(FLUSH_LOCK_KEY, 1, nx=True, ex=FLUSH_LOCK_TIMEOUT):
+            # Another flush is running; look again once it had time to finish
+            EmailService.flush_email_queue.apply_async(countdown=settings.EMAIL_BATCH_WINDOW)
+            return 0
+        try:
+            client.delete(FLUSH_SCHEDULED_KEY)
+            _requeue_processing(client)
+            return _flush_batches(client)
+        finally:
+            client.delete(FLUSH_LOCK_KEY)
+
+    @staticmethod
+    async def queue_email(to_email: str, subject: str, template_name: str, context: dict):
+        """
+        Queue a templated email for the next batch. Without Redis, or if
+        queueing fails, it is sent as its own Celery task instead. Celery
+        publishes are blocking broker calls (retried while the broker is
+        down), so they run in a worker thread, off the event loop.
+        """
+        client = get_redis()
+        if client is not None:
+            message = json.dumps({
+                "to_email": to_email,
+                "subject": subject,
+                "template_name": template_name,
+                "context": context
+            })
+            try:
+                async with client.pipeline(transaction=True) as pipe:
+                    pipe.rpush(EMAIL_QUEUE_KEY, message)
+                    pipe.set(FLUSH_SCHEDULED_KEY, "1", nx=True, ex=FLUSH_SCHEDULED_TTL)
+                    _, schedule_flush = await pipe.execute()
+                if schedule_flush:
+                    await asyncio.to_thread(
+                        EmailService.flush_email_queue.apply_async, countdown=settings.EMAIL_BATCH_WINDOW
+                    )
+                return
+            except Exception as e:
+                logger.error(f"Failed to queue email {template_name} for {to_email}: {str(e)}")
+
+        await asyncio.to_thread(
+            EmailService.send_templated_email.delay,
+            to_email=to_email,
+            subject=subject,
+            template_name=template_name,
+            context=context
+        )
+
     @staticmethod
     def generate_otp() -> str:
         """Generate a 6-digit OTP"""
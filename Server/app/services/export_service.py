@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from app.core.config import settings
+from app.core.replicas import ReadSessionLocal
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+async def stream_rows(stmt: Select, export_format: str) -> AsyncIterator[str]:
+    """
+    Run `stmt` on a server-side cursor and yield it as CSV or NDJSON, one
+    chunk of EXPORT_CHUNK_SIZE rows at a time, so memory stays flat however
+    many rows match. Opens its own session: the stream outlives the request
+    handler.
+    """
+    columns = [column.key for column in stmt.selected_columns]
+    exported = 0
+    async with ReadSessionLocal() as db:
+        result = await db.stream(stmt.execution_options(yield_per=settings.EXPORT_CHUNK_SIZE))
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            yield buffer.getvalue()
+
+        async for partition in result.partitions():
+            buffer = io.StringIO()
+            if export_format == "csv":
+                writer = csv.writer(buffer)
+                writer.writerows([_csv_value(value) for value in row] for row in partition)
+            else:
+                for row in partition:
+                    buffer.write(json.dumps(dict(zip(columns, map(_json_value, row)))))
+                    buffer.write("\n")
+            exported += len(partition)
+            yield buffer.getvalue()
+
+    logger.info(f"Export finished: {exported} rows as {export_format}")
+
+
+def export_response(stmt: Select, export_format: str, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        stream_rows(stmt, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
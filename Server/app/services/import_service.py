@@ -0,0 +1,187 @@
+import csv
+import heapq
+import json
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, Optional
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.task import TaskImportError, TaskImportResponse, TaskImportRow
+
+logger = get_logger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Columns written per task; created_at/updated_at and search_vector come from the database
+IMPORT_COLUMNS = ("project_id", "title", "description", "assigned_to", "status", "due_date")
+
+
+def format_from_filename(filename: Optional[str]) -> Optional[str]:
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension in ("json", "jsonl"):
+        extension = "ndjson"
+    return extension if extension in IMPORT_FORMATS else None
+
+
+def parse_records(lines: Iterable[str], import_format: str) -> Iterator[tuple[int, Optional[dict], Optional[str]]]:
+    """
+    Parse an import file one record at a time.
+    Yields: (line, record, error); record is None when the line could not be parsed.
+    """
+    if import_format == "csv":
+        reader = csv.DictReader(lines)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield reader.line_num, None, f"Malformed CSV: {str(e)}"
+                continue
+            # CSV has no null; an empty cell means the field was not given
+            yield reader.line_num, {key: value for key, value in row.items() if key and value not in ("", None)}, None
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"Malformed JSON: {str(e)}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def _error_message(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors())
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Task timestamps are stored without a timezone
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class TaskImporter:
+    """
+    Imports tasks from parsed records in batches: each batch is validated
+    against TaskImportRow, its assignees and projects are checked with one
+    IN query each, and the valid rows are written with COPY on PostgreSQL
+    (a multi-row INSERT elsewhere) and committed. Only counters and the
+    IMPORT_MAX_ERRORS errors with the lowest line numbers are kept, so
+    memory does not grow with the file; they are reported in line order.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        batch_size: int = settings.IMPORT_BATCH_SIZE,
+        max_errors: int = settings.IMPORT_MAX_ERRORS,
+        on_progress: Optional[Callable[[TaskImportResponse], None]] = None,
+    ):
+        self.db = db
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.on_progress = on_progress
+        self.summary = TaskImportResponse()
+        # Max-heap by line of the errors kept so far, as (-line, error): unparseable
+        # lines fail at once, but a batch's rows only when the batch is checked
+        self._errors: list[tuple[int, str]] = []
+        # Projects that received tasks, for cache invalidation
+        self.project_ids: set[int] = set()
+
+    def _fail(self, line: int, error: str):
+        self.summary.failed += 1
+        if len(self._errors) < self.max_errors:
+            heapq.heappush(self._errors, (-line, error))
+            return
+        self.summary.errors_truncated = True
+        if self._errors and line < -self._errors[0][0]:
+            heapq.heapreplace(self._errors, (-line, error))
+
+    async def _write(self, rows: list[tuple]):
+        connection = await self.db.connection()
+        if connection.dialect.name == "postgresql":
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                Task.__tablename__, records=rows, columns=IMPORT_COLUMNS
+            )
+        else:
+            await self.db.execute(insert(Task), [dict(zip(IMPORT_COLUMNS, row)) for row in rows])
+
+    def _next_batch(self, records: Iterator[tuple[int, Optional[dict], Optional[str]]]) -> tuple[int, list[tuple[int, TaskImportRow]]]:
+        """
+        Read and validate records up to the next full batch. Runs in a worker
+        thread: reading the file and validating are blocking, pure-Python work.
+        Returns: (records taken, valid rows); fewer than batch_size taken means
+        the records are exhausted.
+        """
+        taken = 0
+        valid: list[tuple[int, TaskImportRow]] = []
+        for line, record, error in records:
+            if record is None:
+                self.summary.processed += 1
+                self._fail(line, error)
+                continue
+            taken += 1
+            try:
+                valid.append((line, TaskImportRow.model_validate(record)))
+            except ValidationError as e:
+                self._fail(line, _error_message(e))
+            if taken >= self.batch_size:
+                break
+        return taken, valid
+
+    async def _import_batch(self, taken: int, valid: list[tuple[int, TaskImportRow]]):
+        if valid:
+            user_ids = set((await self.db.scalars(
+                select(User.id).where(User.id.in_({item.assigned_to for _, item in valid}))
+            )).all())
+            project_ids = set((await self.db.scalars(
+                select(Project.id).where(Project.id.in_({item.project_id for _, item in valid}))
+            )).all())
+
+            rows = []
+            for line, item in valid:
+                if item.assigned_to not in user_ids:
+                    self._fail(line, "Assigned user not found")
+                elif item.project_id not in project_ids:
+                    self._fail(line, "Project not found")
+                else:
+                    rows.append((item.project_id, item.title, item.description, item.assigned_to, item.status, _naive_utc(item.due_date)))
+
+            if rows:
+                await self._write(rows)
+                await self.db.commit()
+                self.summary.imported += len(rows)
+                self.project_ids.update(row[0] for row in rows)
+
+        self.summary.processed += taken
+        if self.on_progress:
+            self.on_progress(self.summary)
+
+    async def run(self, records: Iterable[tuple[int, Optional[dict], Optional[str]]]) -> TaskImportResponse:
+        records = iter(records)
+        while True:
+            # The thread only runs while this coroutine awaits it, so the
+            # summary is never touched from two places at once
+            taken, valid = await run_in_threadpool(self._next_batch, records)
+            if taken:
+                await self._import_batch(taken, valid)
+            if taken < self.batch_size:
+                break
+
+        self.summary.errors = [TaskImportError(line=-line, error=error) for line, error in sorted(self._errors, reverse=True)]
+        logger.info(f"Task import finished: {self.summary.imported} imported, {self.summary.failed} failed of {self.summary.processed}")
+        return self.summary
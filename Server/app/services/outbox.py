@@ -0,0 +1,156 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Iterable
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, serialized_writes
+from app.core.socket import socket_events
+from app.core.logger import get_logger
+from app.models.outbox import OutboxEvent
+from app.services.email_service import EmailService
+
+logger = get_logger(__name__)
+
+
+def add_socket_event(db: AsyncSession, event: str, data: dict, rooms: Iterable[str], key=None):
+    """Stage a Socket.IO event; it is sent only if the session's transaction commits"""
+    db.add(OutboxEvent(kind="socket", payload={"event": event, "data": data, "rooms": list(rooms), "key": key}))
+
+
+def add_email(db: AsyncSession, to_email: str, subject: str, template_name: str, context: dict):
+    """Stage a templated email; it is sent only if the session's transaction commits"""
+    db.add(OutboxEvent(kind="email", payload={
+        "to_email": to_email,
+        "subject": subject,
+        "template_name": template_name,
+        "context": context
+    }))
+
+
+class OutboxRelay:
+    """
+    Drains committed outbox events in batches: socket events go through the
+    coalescing emitter, emails to the email queue. Rows are deleted only
+    after dispatch (for socket events, after the emitter flushed them without
+    error), so delivery is at-least-once. Rows are claimed with
+    FOR UPDATE SKIP LOCKED and a short lease committed before dispatch, so
+    every API worker can run a relay without holding locks while it waits
+    on the broker.
+    """
+
+    def __init__(self, batch_size: int, poll_interval: float, max_attempts: int, claim_timeout: int):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.claim_timeout = claim_timeout
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    def notify(self):
+        """Wake the relay after committing events instead of waiting for the next poll"""
+        self._wakeup.set()
+
+    async def _dispatch(self, event: OutboxEvent):
+        payload = event.payload
+        if event.kind == "socket":
+            socket_events.publish(
+                payload["event"], payload["data"], rooms=payload["rooms"], key=payload.get("key"), source=event.id
+            )
+        elif event.kind == "email":
+            await EmailService.queue_email(
+                to_email=payload["to_email"],
+                subject=payload["subject"],
+                template_name=payload["template_name"],
+                context=payload["context"]
+            )
+        else:
+            raise ValueError(f"Unknown outbox event kind: {event.kind}")
+
+    def _retry_or_drop(self, event: OutboxEvent, error: str) -> bool:
+        """Schedule a failed event's next attempt; returns True once it is out of attempts and should be dropped"""
+        event.attempts += 1
+        if event.attempts >= self.max_attempts:
+            logger.error(f"Dropping outbox event {event.id} ({event.kind}) after {event.attempts} attempts: {error}")
+            return True
+        logger.warning(f"Outbox event {event.id} ({event.kind}) failed, retrying: {error}")
+        event.available_at = datetime.utcnow() + timedelta(seconds=min(2 ** event.attempts, 300))
+        return False
+
+    async def drain_once(self) -> int:
+        """Dispatch one batch of due events; returns how many were claimed"""
+        async with AsyncSessionLocal() as db:
+            # Claim the batch by pushing its rows out by a lease and commit
+            # right away: dispatch may wait on the broker, and no row locks or
+            # transaction stay open meanwhile. If this worker dies mid-batch,
+            # the rows become due again when the lease runs out.
+            async with serialized_writes():
+                events = (await db.scalars(
+                    select(OutboxEvent)
+                    .where(OutboxEvent.available_at <= datetime.utcnow())
+                    .order_by(OutboxEvent.available_at, OutboxEvent.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )).all()
+                if not events:
+                    return 0
+                lease_until = datetime.utcnow() + timedelta(seconds=self.claim_timeout)
+                for event in events:
+                    event.available_at = lease_until
+                await db.commit()
+
+            done = []
+            for event in events:
+                try:
+                    await self._dispatch(event)
+                    done.append(event)
+                except Exception as e:
+                    if self._retry_or_drop(event, str(e)):
+                        done.append(event)
+
+            # Socket events of the whole batch go out coalesced, before their rows are deleted
+            failed_emits = await socket_events.flush()
+            done = [
+                event for event in done
+                if event.id not in failed_emits or self._retry_or_drop(event, "Socket emit failed")
+            ]
+            async with serialized_writes():
+                if done:
+                    await db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_([event.id for event in done])))
+                await db.commit()
+            return len(events)
+
+    def stop(self):
+        """Let run() return after the batch in flight, rather than cancelling it mid-transaction"""
+        self._stopping = True
+        self._wakeup.set()
+
+    async def run(self):
+        """Relay loop; runs until stop()"""
+        self._stopping = False
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                while await self.drain_once() == self.batch_size and not self._stopping:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Outbox relay failed: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+outbox_relay = OutboxRelay(
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_POLL_INTERVAL,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    claim_timeout=settings.OUTBOX_CLAIM_TIMEOUT,
+)
+
+
+def notify():
+    """Call after committing outbox events"""
+    outbox_relay.notify()
@@ -0,0 +1,64 @@
+from typing import Optional
+from pydantic import BaseModel
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.project import Project
+from app.models.task import Task
+from app.models.task_counters import STATUS_COUNTERS
+from app.models.user import User
+from app.schemas.project import ProjectWithTaskCount
+from app.schemas.task import TaskResponse
+from app.schemas.user import UserDirectoryEntry
+
+# Read-side queries for the GET endpoints: they select exactly the columns
+# of the response schema, named after its fields and in its field order, and
+# get plain row tuples back. No entity is built, instrumented or tracked in
+# the session's identity map, so a page costs only the values it returns.
+
+
+def _response_columns(model, schema: type[BaseModel]) -> tuple[tuple[str, ...], tuple]:
+    fields = tuple(schema.model_fields)
+    return fields, tuple(getattr(model, field) for field in fields)
+
+
+TASK_FIELDS, TASK_COLUMNS = _response_columns(Task, TaskResponse)
+PROJECT_FIELDS, PROJECT_COLUMNS = _response_columns(Project, ProjectWithTaskCount)
+
+# Project detail adds the per-status counters, read back into status_counts
+PROJECT_DETAIL_COLUMNS = (*PROJECT_COLUMNS, *(getattr(Project, column) for column in STATUS_COUNTERS.values()))
+
+USER_DIRECTORY_FIELDS, USER_DIRECTORY_COLUMNS = _response_columns(User, UserDirectoryEntry)
+
+# The user directory pages through users alphabetically by email, which is
+# unique and already indexed
+USER_DIRECTORY_SORT_KEY = (User.email,)
+# Columns the directory search matches by prefix (see apply_prefix_search)
+USER_DIRECTORY_SEARCH_COLUMNS = (User.first_name, User.last_name, User.email)
+
+
+def select_tasks() -> Select:
+    return select(*TASK_COLUMNS)
+
+
+def select_projects() -> Select:
+    return select(*PROJECT_COLUMNS)
+
+
+def select_user_directory() -> Select:
+    return select(*USER_DIRECTORY_COLUMNS)
+
+
+async def get_task_row(db: AsyncSession, task_id: int) -> Optional[Row]:
+    return (await db.execute(select_tasks().where(Task.id == task_id))).first()
+
+
+async def get_project_row(db: AsyncSession, project_id: int) -> Optional[Row]:
+    return (await db.execute(select(*PROJECT_DETAIL_COLUMNS).where(Project.id == project_id))).first()
+
+
+async def project_exists(db: AsyncSession, project_id: int) -> bool:
+    return await db.scalar(select(Project.id).where(Project.id == project_id)) is not None
+
+
+def status_counts(project: Row) -> dict[str, int]:
+    return {status: getattr(project, column) for status, column in STATUS_COUNTERS.items()}
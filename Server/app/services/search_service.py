@@ -0,0 +1,65 @@
+import re
+from sqlalchemy import and_, func, literal_column, or_, select, table, column
+
+# PostgreSQL text search configuration; must match the one used by the
+# search_vector trigger in the migration.
+TS_CONFIG = "english"
+
+
+def _terms(search: str) -> list[str]:
+    return re.findall(r"\w+", search.lower())
+
+
+def apply_search(query, model, search: str, dialect_name: str):
+    """
+    Restrict `query` to rows of `model` whose title/description match
+    `search`, using the full-text index of the current backend. Every word
+    is matched as a prefix so type-ahead searches keep working.
+    Returns: (query, rank) where higher rank means more relevant, or
+    (query, None) when the search has no usable words.
+    """
+    terms = _terms(search)
+    if not terms:
+        return query, None
+
+    if dialect_name == "postgresql":
+        ts_query = func.to_tsquery(TS_CONFIG, " & ".join(f"{term}:*" for term in terms))
+        vector = literal_column(f"{model.__tablename__}.search_vector")
+        rank = func.ts_rank_cd(vector, ts_query)
+        return query.filter(vector.op("@@")(ts_query)), rank
+
+    if dialect_name == "sqlite":
+        fts_name = f"{model.__tablename__}_fts"
+        fts = table(fts_name, column("rowid"), column("rank"))
+        matches = (
+            select(fts.c.rowid.label("id"), fts.c.rank.label("rank"))
+            .where(literal_column(fts_name).op("MATCH")(" ".join(f'"{term}"*' for term in terms)))
+            .subquery()
+        )
+        # FTS5 rank is bm25, where lower is better
+        return query.join(matches, matches.c.id == model.id), -matches.c.rank
+
+    # No full-text index on this backend; fall back to a substring scan
+    pattern = f"%{search}%"
+    criterion = model.title.ilike(pattern) | model.description.ilike(pattern)
+    return query.filter(criterion), None
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def apply_prefix_search(query, columns, search: str):
+    """
+    Restrict `query` to rows where every whitespace-separated word of
+    `search` is a prefix of one of `columns`, case-insensitively ("jo sm" matches
+    John Smith). Matches lower(column) LIKE 'word%', which PostgreSQL serves
+    from lower(column) text_pattern_ops indexes.
+    """
+    words = search.lower().split()
+    if not words:
+        return query
+    return query.filter(and_(*[
+        or_(*[func.lower(column).like(f"{_escape_like(word)}%", escape="\\") for column in columns])
+        for word in words
+    ]))
@@ -0,0 +1,51 @@
+import threading
+from pathlib import Path
+from typing import Optional
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+
+class TemplateService:
+    """
+    Single Jinja2 environment for email templates. Templates are compiled
+    once per process and kept in memory; the compiled bytecode is also
+    cached on disk so new worker processes skip the parse step.
+    """
+
+    def __init__(self, templates_dir: Path, cache_dir: Optional[str] = None):
+        self.env = Environment(
+            loader=FileSystemLoader(searchpath=str(templates_dir)),
+            autoescape=select_autoescape(['html', 'xml']),
+            bytecode_cache=FileSystemBytecodeCache(directory=cache_dir),
+            auto_reload=False,
+        )
+        self._templates: dict[str, Template] = {}
+        self._lock = threading.Lock()
+
+    def precompile(self) -> int:
+        """Compile every template up front; returns how many were loaded"""
+        for name in self.env.list_templates(extensions=["html"]):
+            self._get(name)
+        logger.info(f"Precompiled {len(self._templates)} email templates")
+        return len(self._templates)
+
+    def _get(self, name: str) -> Template:
+        template = self._templates.get(name)
+        if template is None:
+            with self._lock:
+                template = self._templates.get(name)
+                if template is None:
+                    template = self.env.get_template(name)
+                    self._templates[name] = template
+        return template
+
+    def render(self, name: str, context: dict) -> str:
+        return self._get(name).render(**context)
+
+
+template_service = TemplateService(TEMPLATES_DIR, settings.EMAIL_TEMPLATE_CACHE_DIR)
@@ -0,0 +1,105 @@
+"""
+Benchmark: emails/sec per worker, one connection per email vs. pooled session
+Run: python -m benchmarks.email_throughput [--emails 500] [--threads 1] [--latency-ms 0]
+
+Sends through a local stub of the provider API. "before" is the old
+requests.post() per email; "after" is the pooled keep-alive session the
+Celery task uses. The stub speaks plain HTTP, so the TLS handshake that
+pooling also saves in production is not counted: the real gap is larger.
+"""
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from app.services import email_service
+
+
+class StubProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle plus
+    # delayed ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+    latency = 0.0
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StubProviderHandler.lock:
+            StubProviderHandler.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.latency:
+            time.sleep(self.latency)
+        body = json.dumps({"messageId": "<stub@localhost>"}).encode("utf-8")
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def send_unpooled(url: str):
+    payload = {
+        "sender": {"email": "bench@localhost", "name": "Project Management <no-reply>"},
+        "to": [{"email": "user@localhost"}],
+        "subject": "Benchmark",
+        "htmlContent": "<p>benchmark</p>"
+    }
+    response = requests.post(url, json=payload, headers={"api-key": "bench", "Content-Type": "application/json"})
+    response.raise_for_status()
+
+
+def send_pooled(url: str):
+    email_service._deliver("user@localhost", "Benchmark", "<p>benchmark</p>")
+
+
+def run(send, url: str, emails: int, threads: int) -> tuple[float, int]:
+    StubProviderHandler.connections = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda _: send(url), range(emails)))
+    return time.perf_counter() - start, StubProviderHandler.connections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=500, help="emails sent per run")
+    parser.add_argument("--threads", type=int, default=1, help="concurrent sends in the worker (Celery concurrency)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="simulated provider processing time")
+    args = parser.parse_args()
+
+    StubProviderHandler.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubProviderHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/v3/smtp/email"
+    email_service.BREVO_API_URL = url
+
+    print("\n" + "="*60)
+    print(f"EMAIL THROUGHPUT ({args.emails} emails, {args.threads} thread(s), {args.latency_ms:g} ms stub latency)")
+    print("="*60 + "\n")
+    print(f"{'Client':<10} {'Seconds':<10} {'Emails/s':<10} {'Connections':<12} {'Speedup':<8}")
+    print("-"*60)
+
+    baseline = None
+    for label, send in (("before", send_unpooled), ("after", send_pooled)):
+        elapsed, connections = run(send, url, args.emails, args.threads)
+        throughput = args.emails / elapsed
+        baseline = baseline or throughput
+        print(f"{label:<10} {elapsed:<10.2f} {throughput:<10.1f} {connections:<12} {throughput / baseline:<8.2f}")
+    print()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
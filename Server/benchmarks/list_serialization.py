@@ -0,0 +1,140 @@
+"""
+Benchmark: per-row cost of building a task list page, ORM + response_model vs. column rows + orjson
+Run: python -m benchmarks.list_serialization [--size 100] [--iterations 200]
+
+Loads one page of tasks from an in-memory SQLite database both ways.
+"before" selects Task entities into a session and returns
+APIResponse[TaskListResponse], serialized the way FastAPI handles a
+response_model (dump, validate, dump to JSON types, json.dumps). "after"
+is the path GET /api/task/ takes now: select_tasks() as plain row
+tuples, encoded by dump_api_response. Both produce the same bytes; the
+"serialize" columns leave out the query and row loading.
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.core.serialization import dump_api_response, rows_to_dicts
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.services.read_queries import TASK_FIELDS, select_tasks
+from app.schemas.common import APIResponse
+from app.schemas.task import TaskListResponse, TaskResponse
+
+RESPONSE_ADAPTER = TypeAdapter(APIResponse[TaskListResponse])
+
+
+def encode_response_model(payload: APIResponse[TaskListResponse]) -> bytes:
+    # What FastAPI does with a returned model when response_model_exclude_none=True
+    content = payload.model_dump(exclude_none=True)
+    value = RESPONSE_ADAPTER.validate_python(content)
+    data = RESPONSE_ADAPTER.dump_python(value, mode="json", exclude_none=True)
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def page_data(tasks, size: int) -> dict:
+    return {"tasks": tasks, "total": size, "page": 1, "size": size, "total_pages": 1}
+
+
+async def before(session_factory, size: int) -> tuple[bytes, float]:
+    async with session_factory() as db:
+        tasks = (await db.scalars(select(Task).order_by(Task.id.desc()).limit(size))).all()
+        start = time.perf_counter()
+        payload = APIResponse[TaskListResponse](
+            success=True,
+            data=TaskListResponse(**page_data([TaskResponse.model_validate(task) for task in tasks], size))
+        )
+        body = encode_response_model(payload)
+        return body, time.perf_counter() - start
+
+
+async def after(session_factory, size: int) -> tuple[bytes, float]:
+    async with session_factory() as db:
+        rows = (await db.execute(select_tasks().order_by(Task.id.desc()).limit(size))).all()
+        start = time.perf_counter()
+        body = dump_api_response(page_data(rows_to_dicts(rows, TASK_FIELDS), size))
+        return body, time.perf_counter() - start
+
+
+async def measure(path, session_factory, size: int, iterations: int) -> tuple[bytes, float, float]:
+    body, _ = await path(session_factory, size)
+    total = serialize = 0.0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        body, elapsed = await path(session_factory, size)
+        total += time.perf_counter() - start
+        serialize += elapsed
+    per_row = iterations * size / 1_000_000
+    return body, total / per_row, serialize / per_row
+
+
+async def run(size: int, iterations: int):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as db:
+        user = User(email="bench@example.com", first_name="Bench", role="admin", hashed_password="x", is_verified=True)
+        db.add(user)
+        await db.flush()
+        project = Project(title="Benchmark", created_by=user.id)
+        db.add(project)
+        await db.flush()
+        now = datetime(2026, 1, 1, 9, 30)
+        await db.execute(insert(Task), [
+            {
+                "project_id": project.id,
+                "title": f"Task {i}",
+                "description": f"Description of task {i}" if i % 2 else None,
+                "assigned_to": user.id,
+                "status": ("todo", "in-progress", "done")[i % 3],
+                "due_date": now + timedelta(days=i, microseconds=i) if i % 3 else None,
+            }
+            for i in range(size)
+        ])
+        await db.commit()
+
+    try:
+        results = {}
+        for name, path in (("before", before), ("after", after)):
+            results[name] = await measure(path, session_factory, size, iterations)
+    finally:
+        await engine.dispose()
+
+    if results["before"][0] != results["after"][0]:
+        raise SystemExit("Response bodies differ between the two paths")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100, help="tasks per page (default: 100, the largest page size)")
+    parser.add_argument("--iterations", type=int, default=200, help="pages built per path")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.size, args.iterations))
+
+    print("\n" + "="*60)
+    print(f"TASK LIST SERIALIZATION (size={args.size}, {args.iterations} pages)")
+    print("="*60 + "\n")
+    print(f"{'Path':<10} {'Total µs/row':<15} {'Serialize µs/row':<18} {'Body bytes':<10}")
+    print("-"*60)
+    for name, (body, total, serialize) in results.items():
+        print(f"{name:<10} {total:<15.2f} {serialize:<18.2f} {len(body):<10}")
+    print("-"*60)
+    print(f"Speedup: {results['before'][1] / results['after'][1]:.1f}x total, {results['before'][2] / results['after'][2]:.1f}x serialize")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: password verification throughput vs. hashing worker count
+Run: python -m benchmarks.login_throughput [--rounds 12] [--per-worker 8]
+
+Each run pushes a burst of concurrent verify calls through a PasswordHasher
+with N workers, the same path /api/auth/login takes.
+"""
+import argparse
+import asyncio
+import os
+import time
+
+import bcrypt
+
+from app.core.security import PasswordHasher
+
+
+async def run_burst(workers: int, requests: int, hashed: str) -> float:
+    hasher = PasswordHasher(workers=workers, max_queue=requests)
+    start = time.perf_counter()
+    await asyncio.gather(*[hasher.verify("Str0ng!Password", hashed) for _ in range(requests)])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor (default: 12, as in production)")
+    parser.add_argument("--per-worker", type=int, default=8, help="verify calls per worker in each burst")
+    args = parser.parse_args()
+
+    hashed = bcrypt.hashpw(b"Str0ng!Password", bcrypt.gensalt(rounds=args.rounds)).decode("utf-8")
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+
+    print("\n" + "="*60)
+    print(f"LOGIN THROUGHPUT (bcrypt cost {args.rounds}, {cpus} CPUs)")
+    print("="*60 + "\n")
+    print(f"{'Workers':<10} {'Requests':<10} {'Seconds':<10} {'Logins/s':<10} {'Speedup':<8}")
+    print("-"*60)
+
+    baseline = None
+    for workers in worker_counts:
+        requests = workers * args.per_worker
+        elapsed = asyncio.run(run_burst(workers, requests, hashed))
+        throughput = requests / elapsed
+        baseline = baseline or throughput
+        print(f"{workers:<10} {requests:<10} {elapsed:<10.2f} {throughput:<10.1f} {throughput / baseline:<8.2f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark: CPU and memory of loading tasks as ORM entities vs. column rows
+Run: python -m benchmarks.read_queries [--page-size 100] [--scan-rows 50000] [--iterations 50]
+
+Two workloads against an in-memory SQLite database:
+  page  one list page, as GET /api/task/ loads it (fetch all, then read every field)
+  scan  an export-sized scan, streamed in EXPORT_CHUNK_SIZE partitions as
+        the CSV/NDJSON exports do
+"before" selects Task entities into the session; "after" selects
+select_tasks() from app/services/read_queries.py. CPU is µs per row
+averaged over the iterations; memory is the tracemalloc peak of one run,
+so it counts the loaded rows plus session bookkeeping.
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models.project import Project
+from app.models.task import Task
+from app.models.user import User
+from app.services.read_queries import TASK_FIELDS, select_tasks
+
+
+# Read every response field, as serialization does: entities by attribute,
+# rows positionally (rows_to_dicts zips them with TASK_FIELDS)
+def read_entity(task) -> int:
+    return sum(1 for field in TASK_FIELDS if getattr(task, field) is not None)
+
+
+def read_row(row) -> int:
+    return sum(1 for value in row if value is not None)
+
+
+async def page_entities(session_factory, count: int):
+    async with session_factory() as db:
+        tasks = (await db.scalars(select(Task).order_by(Task.id.desc()).limit(count))).all()
+        return sum(read_entity(task) for task in tasks)
+
+
+async def page_rows(session_factory, count: int):
+    async with session_factory() as db:
+        rows = (await db.execute(select_tasks().order_by(Task.id.desc()).limit(count))).all()
+        return sum(read_row(row) for row in rows)
+
+
+async def scan_entities(session_factory, count: int):
+    async with session_factory() as db:
+        result = await db.stream(select(Task).order_by(Task.id).limit(count).execution_options(yield_per=settings.EXPORT_CHUNK_SIZE))
+        return sum([sum(read_entity(task) for (task,) in partition) async for partition in result.partitions()])
+
+
+async def scan_rows(session_factory, count: int):
+    async with session_factory() as db:
+        result = await db.stream(select_tasks().order_by(Task.id).limit(count).execution_options(yield_per=settings.EXPORT_CHUNK_SIZE))
+        return sum([sum(read_row(row) for row in partition) async for partition in result.partitions()])
+
+
+async def measure(load, session_factory, rows: int, iterations: int) -> tuple[float, float]:
+    await load(session_factory, rows)
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await load(session_factory, rows)
+    cpu = (time.perf_counter() - start) / iterations / rows * 1_000_000
+
+    tracemalloc.start()
+    await load(session_factory, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak / 1024
+
+
+async def seed(session_factory, rows: int):
+    async with session_factory() as db:
+        user = User(email="bench@example.com", first_name="Bench", role="admin", hashed_password="x", is_verified=True)
+        db.add(user)
+        await db.flush()
+        project = Project(title="Benchmark", created_by=user.id)
+        db.add(project)
+        await db.flush()
+        now = datetime(2026, 1, 1, 9, 30)
+        await db.execute(insert(Task), [
+            {
+                "project_id": project.id,
+                "title": f"Task {i}",
+                "description": f"Description of task {i}" if i % 2 else None,
+                "assigned_to": user.id,
+                "status": ("todo", "in-progress", "done")[i % 3],
+                "due_date": now + timedelta(days=i % 365) if i % 3 else None,
+            }
+            for i in range(rows)
+        ])
+        await db.commit()
+
+
+async def run(page_size: int, scan_rows_count: int, iterations: int):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await seed(session_factory, max(page_size, scan_rows_count))
+
+    workloads = [
+        (f"page ({page_size} rows)", page_size, iterations, page_entities, page_rows),
+        (f"scan ({scan_rows_count} rows)", scan_rows_count, max(1, iterations // 10), scan_entities, scan_rows),
+    ]
+    try:
+        results = []
+        for name, rows, runs, before, after in workloads:
+            results.append((name, await measure(before, session_factory, rows, runs), await measure(after, session_factory, rows, runs)))
+    finally:
+        await engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=100, help="rows per list page (default: 100, the largest page size)")
+    parser.add_argument("--scan-rows", type=int, default=50000, help="rows in the export-sized scan")
+    parser.add_argument("--iterations", type=int, default=50, help="page loads per path (scans run a tenth as often)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.page_size, args.scan_rows, args.iterations))
+
+    print("\n" + "="*72)
+    print("TASK READS: ORM ENTITIES VS. COLUMN ROWS")
+    print("="*72 + "\n")
+    print(f"{'Workload':<22} {'Path':<8} {'µs/row':<10} {'Peak KiB':<12} {'CPU':<10} {'Memory':<10}")
+    print("-"*72)
+    for name, (before_cpu, before_peak), (after_cpu, after_peak) in results:
+        print(f"{name:<22} {'before':<8} {before_cpu:<10.2f} {before_peak:<12.1f}")
+        print(f"{'':<22} {'after':<8} {after_cpu:<10.2f} {after_peak:<12.1f} {f'-{1 - after_cpu / before_cpu:.0%}':<10} {f'-{1 - after_peak / before_peak:.0%}':<10}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: Socket.IO fan-out latency across worker processes
+Run: python -m benchmarks.socket_fanout [--workers 4] [--clients 200] [--events 50]
+
+Starts N uvicorn workers serving app.main:socket_app, all relaying through
+SOCKETIO_MESSAGE_QUEUE (or REDIS_URL), spreads the clients across them in
+one project room and emits task_updated from a write-only queue manager,
+as a request on any worker would. Reports the time from emit to receipt
+over every delivery.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import time
+
+import socketio
+import uvicorn
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.core.socket import create_client_manager, project_room
+
+# No real project has id 0, so benchmark traffic never reaches real clients
+BENCH_PROJECT_ID = 0
+BASE_PORT = 8700
+
+
+def serve(port: int):
+    uvicorn.run("app.main:socket_app", host="127.0.0.1", port=port, log_level="warning")
+
+
+def wait_for_port(port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.1)
+    raise RuntimeError(f"Worker on port {port} did not start")
+
+
+async def run_fanout(ports: list[int], clients: int, events: int, interval: float) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    connected = []
+
+    def on_task_updated(data):
+        latencies.append(time.time() - data["sent_at"])
+
+    for index in range(clients):
+        client = socketio.AsyncClient()
+        client.on("task_updated", on_task_updated)
+        token = create_access_token(data={"user_id": index + 1})
+        await client.connect(f"http://127.0.0.1:{ports[index % len(ports)]}?token={token}", transports=["websocket"])
+        await client.call("join_project", {"project_id": BENCH_PROJECT_ID})
+        connected.append(client)
+
+    manager = create_client_manager(settings.SOCKETIO_MESSAGE_QUEUE or settings.REDIS_URL, write_only=True)
+    for sequence in range(events):
+        await manager.emit(
+            "task_updated",
+            {"task_id": sequence, "sent_at": time.time()},
+            room=project_room(BENCH_PROJECT_ID),
+            namespace="/",
+        )
+        await asyncio.sleep(interval)
+
+    expected = clients * events
+    deadline = time.monotonic() + 10
+    while len(latencies) < expected and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+
+    for client in connected:
+        await client.disconnect()
+    return latencies, expected
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="largest number of worker processes to test")
+    parser.add_argument("--clients", type=int, default=200, help="sockets connected in the project room")
+    parser.add_argument("--events", type=int, default=50, help="task_updated events emitted per run")
+    parser.add_argument("--interval", type=float, default=0.02, help="seconds between emits")
+    args = parser.parse_args()
+
+    queue_url = settings.SOCKETIO_MESSAGE_QUEUE or settings.REDIS_URL
+    if not queue_url or not queue_url.startswith(("redis://", "rediss://")):
+        print("\n❌ Set SOCKETIO_MESSAGE_QUEUE or REDIS_URL to a redis:// URL; workers are separate processes.\n")
+        return
+
+    worker_counts = sorted({1, 2, 4, args.workers} & set(range(1, args.workers + 1)))
+
+    print("\n" + "="*70)
+    print(f"SOCKET.IO FAN-OUT ({args.clients} clients, {args.events} events, queue {queue_url})")
+    print("="*70 + "\n")
+    print(f"{'Workers':<10} {'Delivered':<14} {'p50 ms':<10} {'p95 ms':<10} {'p99 ms':<10} {'max ms':<10}")
+    print("-"*70)
+
+    context = multiprocessing.get_context("spawn")
+    for workers in worker_counts:
+        ports = [BASE_PORT + index for index in range(workers)]
+        processes = [context.Process(target=serve, args=(port,), daemon=True) for port in ports]
+        for process in processes:
+            process.start()
+        try:
+            for port in ports:
+                wait_for_port(port)
+            latencies, expected = asyncio.run(run_fanout(ports, args.clients, args.events, args.interval))
+        finally:
+            for process in processes:
+                process.terminate()
+                process.join()
+
+        if not latencies:
+            print(f"{workers:<10} {'0/' + str(expected):<14} no events delivered")
+            continue
+        millis = [latency * 1000 for latency in latencies]
+        print(
+            f"{workers:<10} {f'{len(latencies)}/{expected}':<14} {statistics.median(millis):<10.1f} "
+            f"{percentile(millis, 0.95):<10.1f} {percentile(millis, 0.99):<10.1f} {max(millis):<10.1f}"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    main()
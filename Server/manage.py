@@ -3,16 +3,24 @@ Management CLI for Project Management System
 Run: python manage.py <command>
 """
 import sys
+import argparse
+import asyncio
 import getpass
 import re
+from sqlalchemy import func, select, text, update
 from sqlalchemy.orm import Session
-from app.core.database import SessionLocal, engine, Base
+from app.core.config import settings
+from app.core.database import SessionLocal, AsyncSessionLocal, async_engine, engine, Base
 from app.core.security import hash_password
+from app.core.user_cache import invalidate_user_sync
+from app.core.response_cache import invalidate_sync, task_write_tags, project_tag, PROJECTS_TAG
+from app.services.import_service import IMPORT_FORMATS, TaskImporter, format_from_filename, parse_records
 
 # Import all models to ensure relationships are properly initialized
 from app.models.user import User
 from app.models.project import Project
 from app.models.task import Task
+from app.models.task_counters import STATUS_COUNTERS
 
 
 def validate_email(email: str) -> bool:
@@ -217,7 +225,7 @@ def change_user_role():
         print(f"\n📋 Current User Info:")
         print(f"   ID:    {user.id}")
         print(f"   Email: {user.email}")
-        print(f"   Name:  {user.full_name}")
+        print(f"   Name:  {user.first_name} {user.last_name or ''}")
         print(f"   Role:  {user.role}")
         print()
         
@@ -243,6 +251,8 @@ def change_user_role():
         # Update role
         user.role = new_role
         db.commit()
+        # Running API workers may hold the old role in their user cache
+        invalidate_user_sync(user.id)
         
         print(f"\n✅ User role updated successfully!")
         print(f"   {user.email} is now an '{new_role}'\n")
@@ -257,6 +267,98 @@ def change_user_role():
         db.close()
 
 
+def import_tasks():
+    """Import tasks from a CSV or NDJSON file"""
+    parser = argparse.ArgumentParser(prog="python manage.py import-tasks")
+    parser.add_argument("path", help="CSV or NDJSON file of tasks")
+    parser.add_argument("--format", dest="import_format", choices=IMPORT_FORMATS, help="defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=settings.IMPORT_BATCH_SIZE, help="tasks inserted per transaction")
+    args = parser.parse_args(sys.argv[2:])
+
+    import_format = args.import_format or format_from_filename(args.path)
+    if import_format is None:
+        print("❌ Unknown file format. Pass --format csv or --format ndjson\n")
+        return
+
+    print("\n" + "="*60)
+    print(f"IMPORT TASKS ({args.path}, {import_format}, batches of {args.batch_size})")
+    print("="*60 + "\n")
+
+    def show_progress(summary):
+        print(f"\r   Processed {summary.processed}  imported {summary.imported}  failed {summary.failed}", end="", flush=True)
+
+    async def run():
+        try:
+            async with AsyncSessionLocal() as db:
+                importer = TaskImporter(db, batch_size=args.batch_size, on_progress=show_progress)
+                try:
+                    with open(args.path, encoding="utf-8-sig", newline="") as lines:
+                        return await importer.run(parse_records(lines, import_format))
+                finally:
+                    # Running API workers may have cached the old task lists
+                    invalidate_sync(*task_write_tags(importer.project_ids))
+        finally:
+            # Close pooled connections inside this event loop
+            await async_engine.dispose()
+
+    try:
+        summary = asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\n\n❌ Import interrupted; batches already committed are kept.\n")
+        return
+    except Exception as e:
+        print(f"\n\n❌ Error importing tasks: {str(e)}\n")
+        return
+
+    print(f"\n\n✅ Imported {summary.imported} of {summary.processed} tasks")
+    if summary.errors:
+        print(f"\n{'Line':<10} Error")
+        print("-"*60)
+        for error in summary.errors:
+            print(f"{error.line:<10} {error.error}")
+        if summary.errors_truncated:
+            print(f"... {summary.failed - len(summary.errors)} more errors not shown")
+    print()
+
+
+def rebuild_task_counts():
+    """Recompute the stored per-project task counters from the tasks table"""
+    print("\n" + "="*60)
+    print("REBUILD PROJECT TASK COUNTERS")
+    print("="*60 + "\n")
+    
+    db: Session = SessionLocal()
+    
+    try:
+        def count_tasks(*criteria):
+            return select(func.count(Task.id)).where(Task.project_id == Project.id, *criteria).scalar_subquery()
+        
+        counters = {"task_count": count_tasks()}
+        for status, column in STATUS_COUNTERS.items():
+            counters[column] = count_tasks(Task.status == status)
+        
+        if db.get_bind().dialect.name == "postgresql":
+            # Hold task writes off until the commit: a trigger increment committed
+            # after this statement's snapshot would otherwise be overwritten by it.
+            # SHARE mode still lets readers through.
+            db.execute(text(f"LOCK TABLE {Task.__tablename__} IN SHARE MODE"))
+        
+        # One statement, so the counters are consistent with a single snapshot of tasks
+        result = db.execute(update(Project).values(**counters).returning(Project.id))
+        project_ids = result.scalars().all()
+        db.commit()
+        # Running API workers may have cached the old counts
+        invalidate_sync(PROJECTS_TAG, *(project_tag(project_id) for project_id in project_ids))
+        
+        print(f"✅ Rebuilt task counters for {len(project_ids)} projects\n")
+        
+    except Exception as e:
+        print(f"❌ Error rebuilding task counters: {str(e)}\n")
+        db.rollback()
+    finally:
+        db.close()
+
+
 def show_help():
     """Display help information"""
     print("\n" + "="*60)
@@ -267,13 +369,17 @@ def show_help():
     print("  create-admin     Create a new admin user interactively")
     print("  list-users       List all users in the database")
     print("  change-role      Change a user's role (admin/user)")
+    print("  import-tasks     Import tasks from a CSV or NDJSON file")
+    print("  rebuild-task-counts  Recompute the stored per-project task counters")
     print("  help             Show this help message")
     print("\nUsage:")
     print("  python manage.py <command>\n")
     print("Examples:")
     print("  python manage.py create-admin")
     print("  python manage.py list-users")
-    print("  python manage.py change-role\n")
+    print("  python manage.py change-role")
+    print("  python manage.py import-tasks tasks.csv --batch-size 5000")
+    print("  python manage.py rebuild-task-counts\n")
 
 
 def main():
@@ -288,6 +394,8 @@ def main():
         'create-admin': create_admin,
         'list-users': list_users,
         'change-role': change_user_role,
+        'import-tasks': import_tasks,
+        'rebuild-task-counts': rebuild_task_counts,
         'help': show_help,
     }
     
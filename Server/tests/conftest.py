@@ -0,0 +1,100 @@
+import os
+import tempfile
+from typing import Optional
+
+# Settings are read at import time, so point them at a throwaway SQLite
+# database before anything from app is imported
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='pm-tests-'), 'test.db')}"
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.database import Base, SessionLocal, engine
+from app.core.rate_limit import rate_limiter
+from app.core.response_cache import response_cache
+from app.core.security import create_access_token, hash_password
+from app.core.user_cache import user_cache
+from app.main import app
+from app.models.user import User
+from app.services.email_service import EmailService
+
+# Tests never talk to Redis; caches and rate limits use their in-process fallbacks
+settings.REDIS_URL = None
+
+
+@pytest.fixture(scope="session")
+def schema():
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+@pytest.fixture
+def db_engine(schema):
+    # Emptying the tables is enough between tests, and unlike dropping them
+    # it never pulls the schema from under the app's outbox relay
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    with response_cache._lock:
+        response_cache._entries.clear()
+        response_cache._versions.clear()
+    # Emptied tables hand out the same user ids again
+    with user_cache._lock:
+        user_cache._entries.clear()
+    # A fresh in-memory backend, so counters from earlier tests don't carry over
+    rate_limiter._backend = None
+    yield engine
+
+
+@pytest.fixture(scope="session")
+def app_client(schema):
+    # One client (and event loop) for the whole run: the app's background
+    # tasks and async pool are bound to the loop they start on.
+    # No broker in tests: Celery publishes are recorded, not sent
+    with mock.patch.object(EmailService.send_templated_email, "delay"), \
+            mock.patch.object(EmailService.send_email, "delay"), \
+            mock.patch.object(EmailService.flush_email_queue, "apply_async"):
+        with TestClient(app) as test_client:
+            yield test_client
+
+
+@pytest.fixture
+def client(db_engine, app_client):
+    return app_client
+
+
+def _create_user(email: str, role: str, password: Optional[str] = None) -> User:
+    # Hashing is slow, so users only get a real password hash when a test logs in
+    hashed_password = hash_password(password) if password else "x"
+    db = SessionLocal()
+    try:
+        user = User(email=email, first_name=email.split("@")[0], role=role, hashed_password=hashed_password, is_verified=True)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def create_user(db_engine):
+    return _create_user
+
+
+def auth_headers(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'user_id': user.id})}"}
+
+
+@pytest.fixture
+def admin(db_engine) -> User:
+    return _create_user("admin@example.com", "admin")
+
+
+@pytest.fixture
+def admin_headers(admin) -> dict:
+    return auth_headers(admin)
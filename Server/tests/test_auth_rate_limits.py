@@ -0,0 +1,68 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.config import settings
+
+EMAIL = "member@example.com"
+PASSWORD = "correct-horse"
+
+
+@pytest.fixture
+def member(create_user):
+    return create_user(EMAIL, "user", password=PASSWORD)
+
+
+def _login(client, password, email=EMAIL) -> int:
+    return client.post("/api/auth/login", json={"email": email, "password": password}).status_code
+
+
+def test_lockout_after_max_failed_attempts(client, member):
+    statuses = [_login(client, "wrong") for _ in range(settings.LOGIN_MAX_FAILED_ATTEMPTS)]
+    assert statuses == [401] * settings.LOGIN_MAX_FAILED_ATTEMPTS
+
+    # Locked: even the right password is refused until the window expires
+    response = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    assert response.status_code == 403
+    assert int(response.headers["Retry-After"]) > 0
+
+
+def test_successful_login_clears_failures(client, member):
+    for _ in range(settings.LOGIN_MAX_FAILED_ATTEMPTS - 1):
+        assert _login(client, "wrong") == 401
+    assert _login(client, PASSWORD) == 200
+
+    statuses = [_login(client, "wrong") for _ in range(settings.LOGIN_MAX_FAILED_ATTEMPTS)]
+    assert statuses == [401] * settings.LOGIN_MAX_FAILED_ATTEMPTS
+
+
+def test_concurrent_guesses_cannot_pass_the_lockout(client, member):
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        statuses = Counter(pool.map(lambda _: _login(client, "wrong"), range(30)))
+
+    # Only the attempts the window allows ever reach the password check
+    assert statuses == {401: settings.LOGIN_MAX_FAILED_ATTEMPTS, 403: 30 - settings.LOGIN_MAX_FAILED_ATTEMPTS}
+
+
+def test_unknown_email_is_locked_out_too(client, db_engine):
+    statuses = [_login(client, "wrong", email="nobody@example.com") for _ in range(settings.LOGIN_MAX_FAILED_ATTEMPTS + 1)]
+    assert statuses == [401] * settings.LOGIN_MAX_FAILED_ATTEMPTS + [403]
+
+
+def test_email_cooldown(client, member):
+    assert client.post("/api/auth/forgot-password", params={"email": EMAIL}).status_code == 200
+
+    response = client.post("/api/auth/forgot-password", params={"email": EMAIL})
+    assert response.status_code == 429
+    assert response.json()["detail"].startswith("Please wait")
+
+
+def test_hourly_email_cap(client, member, monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_COOLDOWN_SECONDS", 0)
+
+    statuses = [
+        client.post("/api/auth/forgot-password", params={"email": EMAIL}).status_code
+        for _ in range(settings.EMAIL_MAX_PER_HOUR + 1)
+    ]
+    assert statuses == [200] * settings.EMAIL_MAX_PER_HOUR + [429]
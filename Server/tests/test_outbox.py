@@ -0,0 +1,50 @@
+import time
+
+from app.core.socket import project_room, socket_events, user_room
+from app.services.email_service import EmailService
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _emails_sent_to(email: str) -> list:
+    return [call for call in EmailService.send_templated_email.delay.call_args_list if call.kwargs.get("to_email") == email]
+
+
+def test_relay_delivers_committed_email(client, db_engine):
+    response = client.post("/api/auth/register", json={
+        "email": "new@example.com", "first_name": "New", "last_name": "User", "password": "Str0ng!Pass"
+    })
+    assert response.status_code == 200, response.text
+
+    # The relay running in the app picks the event up after the commit
+    assert _wait_for(lambda: _emails_sent_to("new@example.com"))
+    assert _emails_sent_to("new@example.com")[0].kwargs["template_name"] == "email-verification.html"
+
+
+def test_failed_socket_emit_is_retried(client, admin, admin_headers, monkeypatch):
+    emitted = []
+
+    async def emit(event, data, to=None):
+        # The message queue is down for the first attempt
+        if not emitted:
+            emitted.append(None)
+            raise ConnectionError("message queue unavailable")
+        emitted.append((event, data, to))
+
+    monkeypatch.setattr(socket_events.server, "emit", emit)
+    project_id = client.post("/api/project/", json={"title": "Project"}, headers=admin_headers).json()["id"]
+    task = client.post(
+        "/api/task/", json={"title": "Retried", "assigned_to": admin.id, "project_id": project_id}, headers=admin_headers
+    ).json()
+
+    assert _wait_for(lambda: any(call and call[0] == "task_created" for call in emitted), timeout=10)
+    event, data, rooms = next(call for call in emitted if call and call[0] == "task_created")
+    assert data["task_id"] == task["id"]
+    assert rooms == sorted([project_room(project_id), user_room(admin.id)])
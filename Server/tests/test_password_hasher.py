@@ -0,0 +1,30 @@
+import asyncio
+import threading
+
+from app.core.security import PasswordHasher
+
+
+def test_cancelled_waiters_leave_the_queue():
+    async def scenario():
+        hasher = PasswordHasher(workers=1, max_queue=2)
+        release = threading.Event()
+        running = asyncio.create_task(hasher._run(release.wait))
+        while hasher.stats()["in_flight"] == 0:
+            await asyncio.sleep(0.01)
+
+        # Both queue slots are taken by callers that give up before a thread is free
+        waiters = [asyncio.create_task(hasher._run(lambda: "hashed")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        assert hasher.stats()["queue_depth"] == 2
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+        release.set()
+        await running
+        assert hasher.stats()["queue_depth"] == 0
+        # The freed slots admit new work instead of answering 503
+        assert await asyncio.gather(hasher._run(lambda: "hashed"), hasher._run(lambda: "hashed")) == ["hashed", "hashed"]
+        assert hasher.stats()["rejected"] == 0
+
+    asyncio.run(scenario())
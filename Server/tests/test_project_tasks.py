@@ -0,0 +1,20 @@
+from unittest import mock
+
+from app.routers import task as task_router
+
+
+def test_missing_project_404_is_cached_until_the_project_is_created(client, admin_headers):
+    with mock.patch.object(task_router, "project_exists", wraps=task_router.project_exists) as project_exists:
+        for _ in range(2):
+            response = client.get("/api/project/1/tasks", headers=admin_headers)
+            assert response.status_code == 404
+            assert response.json() == {"detail": "Project not found"}
+        # The repeat is answered from the cache, without checking again
+        assert project_exists.call_count == 1
+
+    created = client.post("/api/project/", json={"title": "Project"}, headers=admin_headers).json()
+    assert created["id"] == 1
+
+    response = client.get("/api/project/1/tasks", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["tasks"] == []
@@ -0,0 +1,12 @@
+def test_project_pages_are_newest_first_without_overlap(client, admin_headers):
+    created = [
+        client.post("/api/project/", json={"title": f"Project {i}"}, headers=admin_headers).json()["id"]
+        for i in range(5)
+    ]
+
+    ids = [
+        project["id"]
+        for page in (1, 2, 3)
+        for project in client.get("/api/project/", params={"page": page, "size": 2}, headers=admin_headers).json()["data"]["projects"]
+    ]
+    assert ids == sorted(created, reverse=True)
@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import async_engine
+
+
+@contextmanager
+def _captured_task_pages():
+    """Collect the (statement, parameters) of the task page queries run inside the block"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT") and "FROM tasks" in statement and "ORDER BY" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", capture)
+
+
+def _query_plan(db_engine, statement, parameters) -> str:
+    with db_engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.fixture
+def project_tasks(client, admin, admin_headers):
+    project = client.post("/api/project/", json={"title": "Project"}, headers=admin_headers).json()
+    for i in range(3):
+        response = client.post(
+            "/api/task/", json={"title": f"Task {i}", "assigned_to": admin.id, "project_id": project["id"]}, headers=admin_headers
+        )
+        assert response.status_code == 200, response.text
+    return project["id"]
+
+
+def _assert_pages_walk_index(client, db_engine, headers, path, params, index):
+    first = client.get(path, params={**params, "size": 1}, headers=headers).json()["data"]
+    with _captured_task_pages() as statements:
+        response = client.get(path, params={**params, "size": 1, "after": first["next_cursor"]}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert statements
+
+    for statement, parameters in statements:
+        plan = _query_plan(db_engine, statement, parameters)
+        assert index in plan, plan
+        assert "TEMP B-TREE" not in plan, plan
+
+
+def test_assigned_tasks_cursor_page_walks_assignee_index(client, db_engine, admin_headers, project_tasks):
+    _assert_pages_walk_index(client, db_engine, admin_headers, "/api/task/assigned", {}, "ix_tasks_assigned_to_id")
+
+
+def test_project_tasks_cursor_page_walks_project_index(client, db_engine, admin_headers, project_tasks):
+    _assert_pages_walk_index(
+        client, db_engine, admin_headers, f"/api/project/{project_tasks}/tasks", {}, "ix_tasks_project_id_id"
+    )
+
+
+def test_task_list_project_filter_cursor_page_walks_project_index(client, db_engine, admin_headers, project_tasks):
+    _assert_pages_walk_index(
+        client, db_engine, admin_headers, "/api/task/", {"project_id": project_tasks}, "ix_tasks_project_id_id"
+    )
+
+
+def test_assigned_tasks_status_cursor_page_walks_assignee_status_index(client, db_engine, admin_headers, project_tasks):
+    _assert_pages_walk_index(
+        client, db_engine, admin_headers, "/api/task/assigned", {"status": "todo"}, "ix_tasks_assigned_to_status_id"
+    )
+
+
+def test_project_tasks_status_cursor_page_walks_project_status_index(client, db_engine, admin_headers, project_tasks):
+    _assert_pages_walk_index(
+        client, db_engine, admin_headers, f"/api/project/{project_tasks}/tasks", {"status": "todo"}, "ix_tasks_project_id_status_id"
+    )
@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from app.core.config import settings
+from app.core.replicas import Replica, replica_pool
+
+
+@pytest.fixture
+def stale_replica(db_engine):
+    """A healthy replica that only has the data of the last snapshot() of the primary"""
+    path = os.path.join(tempfile.mkdtemp(prefix="pm-tests-replica-"), "replica.db")
+    replica = Replica(f"sqlite:///{path}")
+
+    def snapshot():
+        with sqlite3.connect(settings.DATABASE_URL.removeprefix("sqlite:///")) as primary, sqlite3.connect(path) as copy:
+            primary.backup(copy)
+        replica.healthy = True
+
+    replica_pool.replicas.append(replica)
+    yield snapshot
+    replica_pool.replicas.remove(replica)
+
+
+def _task_titles(client, headers, project_id) -> list[str]:
+    response = client.get("/api/task/", params={"project_id": project_id}, headers=headers)
+    assert response.status_code == 200, response.text
+    return [task["title"] for task in response.json()["data"]["tasks"]]
+
+
+def _create_task(client, headers, assigned_to) -> tuple[int, int]:
+    project = client.post("/api/project/", json={"title": "Project"}, headers=headers).json()
+    task = client.post(
+        "/api/task/", json={"title": "Draft", "assigned_to": assigned_to, "project_id": project["id"]}, headers=headers
+    ).json()
+    return project["id"], task["id"]
+
+
+def test_cached_read_after_write_skips_a_lagging_replica(client, admin, admin_headers, stale_replica):
+    project_id, task_id = _create_task(client, admin_headers, admin.id)
+    stale_replica()
+    assert _task_titles(client, admin_headers, project_id) == ["Draft"]
+
+    # The replica never sees this write; the miss under the new tag versions
+    # must not cache its old rows
+    response = client.patch(f"/api/task/{task_id}", json={"title": "Final"}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+
+    assert _task_titles(client, admin_headers, project_id) == ["Final"]
+    assert _task_titles(client, admin_headers, project_id) == ["Final"]
+
+
+def test_misses_on_settled_tags_read_from_the_replica(client, admin, admin_headers, stale_replica, monkeypatch):
+    project_id, task_id = _create_task(client, admin_headers, admin.id)
+    stale_replica()
+    client.patch(f"/api/task/{task_id}", json={"title": "Final"}, headers=admin_headers)
+
+    # Once a write is older than the replica's allowed lag, misses go back to the replica
+    monkeypatch.setattr(replica_pool, "max_lag", 0)
+    monkeypatch.setattr(replica_pool, "check_interval", 0)
+    assert _task_titles(client, admin_headers, project_id) == ["Draft"]
+
+
+def test_unchanged_list_is_revalidated_with_304(client, admin, admin_headers):
+    project_id, task_id = _create_task(client, admin_headers, admin.id)
+    params = {"project_id": project_id}
+    etag = client.get("/api/task/", params=params, headers=admin_headers).headers["ETag"]
+
+    response = client.get("/api/task/", params=params, headers={**admin_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # A write bumps the tags, so the old ETag no longer matches
+    client.patch(f"/api/task/{task_id}", json={"title": "Final"}, headers=admin_headers)
+    response = client.get("/api/task/", params=params, headers={**admin_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [task["title"] for task in response.json()["data"]["tasks"]] == ["Final"]
+
+
+def test_task_writes_invalidate_project_and_task_details(client, admin, admin_headers):
+    project_id, task_id = _create_task(client, admin_headers, admin.id)
+    project = client.get(f"/api/project/{project_id}", headers=admin_headers).json()["data"]
+    assert project["task_count"] == 1
+    assert client.get(f"/api/task/{task_id}", headers=admin_headers).status_code == 200
+
+    assert client.delete(f"/api/task/{task_id}", headers=admin_headers).status_code == 200
+
+    project = client.get(f"/api/project/{project_id}", headers=admin_headers).json()["data"]
+    assert project["task_count"] == 0
+    assert client.get(f"/api/task/{task_id}", headers=admin_headers).status_code == 404
@@ -0,0 +1,57 @@
+import asyncio
+
+import socketio
+
+from app.core.socket import SocketEventBatcher, create_client_manager, project_room, user_room
+
+
+class _Worker:
+    """One API worker's Socket.IO server on the in-process queue, recording what it sends to its sockets"""
+
+    def __init__(self):
+        self.server = socketio.AsyncServer(async_mode="asgi", client_manager=create_client_manager("memory://"))
+        self.sent: list[tuple[str, list]] = []
+
+        async def send_eio_packet(eio_sid, eio_packet):
+            self.sent.append((eio_sid, self.server.packet_class(encoded_packet=eio_packet.data).data))
+
+        self.server._send_eio_packet = send_eio_packet
+        self.server.manager.initialize()
+
+    async def join(self, eio_sid: str, *rooms: str):
+        sid = await self.server.manager.connect(eio_sid, "/")
+        for room in rooms:
+            await self.server.manager.enter_room(sid, "/", room)
+
+
+async def _wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_batched_emit_reaches_rooms_held_by_other_workers():
+    async def scenario():
+        emitter, viewer, assignee = _Worker(), _Worker(), _Worker()
+        await emitter.join("local", project_room(1))
+        await viewer.join("viewer", project_room(1))
+        await viewer.join("bystander", project_room(2))
+        await assignee.join("assignee", user_room(7))
+        # Let every listener subscribe before anything is published
+        await asyncio.sleep(0.05)
+
+        batcher = SocketEventBatcher(emitter.server, interval=0)
+        batcher.publish("task_updated", {"id": 3}, rooms=[project_room(1), user_room(7)])
+        assert await batcher.flush() == set()
+
+        await _wait_for(lambda: viewer.sent and assignee.sent)
+        await asyncio.sleep(0.05)
+        return emitter.sent, viewer.sent, assignee.sent
+
+    emitter_sent, viewer_sent, assignee_sent = asyncio.run(scenario())
+
+    # Only sockets in the targeted rooms get the event, once, whichever worker holds them
+    assert emitter_sent == [("local", ["task_updated", {"id": 3}])]
+    assert viewer_sent == [("viewer", ["task_updated", {"id": 3}])]
+    assert assignee_sent == [("assignee", ["task_updated", {"id": 3}])]
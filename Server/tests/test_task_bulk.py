@@ -0,0 +1,90 @@
+import pytest
+
+from app.core.security import create_access_token
+
+
+@pytest.fixture
+def project_id(client, admin_headers):
+    return client.post("/api/project/", json={"title": "Bulk"}, headers=admin_headers).json()["id"]
+
+
+@pytest.fixture
+def member(create_user):
+    return create_user("member@example.com", "user")
+
+
+@pytest.fixture
+def member_headers(member) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'user_id': member.id})}"}
+
+
+def _bulk(client, method, path, headers, payload) -> dict:
+    response = client.request(method, f"/api/task/bulk{path}", json=payload, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def _errors(data) -> dict[int, str]:
+    return {result["index"]: result["error"] for result in data["results"] if not result["success"]}
+
+
+def _task_ids(client, headers, project_id) -> set[int]:
+    tasks = client.get(f"/api/project/{project_id}/tasks", params={"size": 100}, headers=headers).json()["data"]["tasks"]
+    return {task["id"] for task in tasks}
+
+
+def test_bulk_create_keeps_valid_items(client, admin, admin_headers, project_id):
+    data = _bulk(client, "POST", "", admin_headers, {"tasks": [
+        {"title": "one", "assigned_to": admin.id, "project_id": project_id},
+        {"title": "ghost assignee", "assigned_to": admin.id + 1000, "project_id": project_id},
+        {"title": "ghost project", "assigned_to": admin.id, "project_id": project_id + 1000},
+        {"title": "two", "assigned_to": admin.id, "project_id": project_id},
+    ]})
+
+    assert (data["succeeded"], data["failed"]) == (2, 2)
+    assert _errors(data) == {1: "Assigned user not found", 2: "Project not found"}
+    created = [result["task"] for result in data["results"] if result["success"]]
+    assert [task["title"] for task in created] == ["one", "two"]
+    assert _task_ids(client, admin_headers, project_id) == {task["id"] for task in created}
+
+
+def test_bulk_update_reports_each_failure(client, admin, admin_headers, project_id):
+    created = _bulk(client, "POST", "", admin_headers, {"tasks": [
+        {"title": f"task {i}", "assigned_to": admin.id, "project_id": project_id} for i in range(2)
+    ]})["results"]
+    first, second = (result["id"] for result in created)
+
+    data = _bulk(client, "PATCH", "", admin_headers, {"tasks": [
+        {"id": first, "status": "done"},
+        {"id": first, "status": "todo"},
+        {"id": second + 1000, "status": "done"},
+        {"id": second, "assigned_to": admin.id + 1000},
+        {"id": second, "title": "renamed"},
+    ]})
+
+    assert _errors(data) == {
+        1: "Duplicate task id in request",
+        2: "Task not found",
+        3: "Assigned user not found",
+    }
+    assert data["results"][0]["task"]["status"] == "done"
+    assert data["results"][4]["task"]["title"] == "renamed"
+    assert client.get(f"/api/task/{first}", headers=admin_headers).json()["status"] == "done"
+
+
+def test_bulk_delete_skips_others_tasks_and_duplicates(client, admin, admin_headers, member, member_headers, project_id):
+    created = _bulk(client, "POST", "", admin_headers, {"tasks": [
+        {"title": "mine", "assigned_to": member.id, "project_id": project_id},
+        {"title": "not mine", "assigned_to": admin.id, "project_id": project_id},
+    ]})["results"]
+    mine, not_mine = (result["id"] for result in created)
+
+    data = _bulk(client, "POST", "/delete", member_headers, {"ids": [mine, not_mine, mine, not_mine + 1000]})
+
+    assert (data["succeeded"], data["failed"]) == (1, 3)
+    assert _errors(data) == {
+        1: "Not authorized to delete this task",
+        2: "Duplicate task id in request",
+        3: "Task not found",
+    }
+    assert _task_ids(client, admin_headers, project_id) == {not_mine}
@@ -0,0 +1,63 @@
+import asyncio
+import json
+
+from app.core.database import AsyncSessionLocal
+from app.services.import_service import TaskImporter, parse_records
+
+
+def _ndjson_lines(admin_id: int, project_id: int) -> list[str]:
+    valid = {"title": "Imported", "assigned_to": admin_id, "project_id": project_id}
+    return [
+        json.dumps({**valid, "assigned_to": 999}) + "\n",  # fails when its batch is checked
+        "{not json\n",  # fails as soon as it is parsed
+        json.dumps(valid) + "\n",
+        json.dumps({**valid, "title": None}) + "\n",
+        "[]\n",
+    ]
+
+
+def test_import_errors_are_reported_in_line_order(client, admin, admin_headers):
+    project_id = client.post("/api/project/", json={"title": "Project"}, headers=admin_headers).json()["id"]
+    body = "".join(_ndjson_lines(admin.id, project_id))
+
+    response = client.post("/api/task/import", files={"file": ("tasks.ndjson", body)}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+
+    summary = response.json()["data"]
+    assert summary["imported"] == 1
+    assert [error["line"] for error in summary["errors"]] == [1, 2, 4, 5]
+
+
+def test_truncated_import_errors_keep_the_lowest_lines(client, admin, admin_headers):
+    project_id = client.post("/api/project/", json={"title": "Project"}, headers=admin_headers).json()["id"]
+
+    async def run_import():
+        async with AsyncSessionLocal() as db:
+            importer = TaskImporter(db, max_errors=2)
+            return await importer.run(parse_records(_ndjson_lines(admin.id, project_id), "ndjson"))
+
+    summary = client.portal.call(run_import)
+    assert summary.failed == 4
+    assert summary.errors_truncated
+    assert [error.line for error in summary.errors] == [1, 2]
+
+
+def test_records_are_read_off_the_event_loop(client, admin, admin_headers):
+    project_id = client.post("/api/project/", json={"title": "Project"}, headers=admin_headers).json()["id"]
+    loops_seen = []
+
+    def records():
+        for line, record, error in parse_records(_ndjson_lines(admin.id, project_id), "ndjson"):
+            try:
+                loops_seen.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops_seen.append(None)
+            yield line, record, error
+
+    async def run_import():
+        async with AsyncSessionLocal() as db:
+            return await TaskImporter(db, batch_size=2).run(records())
+
+    summary = client.portal.call(run_import)
+    assert summary.processed == 5
+    assert loops_seen == [None] * 5
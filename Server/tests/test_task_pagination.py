@@ -0,0 +1,53 @@
+def _create_project(client, headers, title="Project") -> int:
+    response = client.post("/api/project/", json={"title": title}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+def _create_tasks(client, headers, project_id, assigned_to, titles):
+    for title in titles:
+        response = client.post(
+            "/api/task/", json={"title": title, "assigned_to": assigned_to, "project_id": project_id}, headers=headers
+        )
+        assert response.status_code == 200, response.text
+
+
+def _follow(client, headers, params) -> list[int]:
+    """Task ids of every page, following next_cursor after the first page"""
+    data = client.get("/api/task/", params=params, headers=headers).json()["data"]
+    ids = [task["id"] for task in data["tasks"]]
+    while data.get("next_cursor"):
+        data = client.get("/api/task/", params={**params, "after": data["next_cursor"]}, headers=headers).json()["data"]
+        ids += [task["id"] for task in data["tasks"]]
+    return ids
+
+
+def test_cursor_pages_cover_every_task_once(client, admin, admin_headers):
+    project_id = _create_project(client, admin_headers)
+    _create_tasks(client, admin_headers, project_id, admin.id, [f"Task {i}" for i in range(7)])
+
+    ids = _follow(client, admin_headers, {"size": 3})
+
+    assert ids == sorted(ids, reverse=True)
+    assert len(ids) == len(set(ids)) == 7
+
+
+def test_search_pages_do_not_offer_an_id_cursor(client, admin, admin_headers):
+    project_id = _create_project(client, admin_headers)
+    # Relevance order differs from id order: more mentions rank higher
+    _create_tasks(client, admin_headers, project_id, admin.id, [
+        "deploy", "deploy deploy deploy", "deploy notes", "other", "deploy deploy", "deploy deploy deploy deploy",
+    ])
+
+    first = client.get("/api/task/", params={"search": "deploy", "size": 2}, headers=admin_headers).json()["data"]
+    assert first["total"] == 5
+    assert "next_cursor" not in first
+
+    # Following the cursor contract still yields every match exactly once
+    ids = _follow(client, admin_headers, {"search": "deploy", "size": 2})
+    ids += [
+        task["id"]
+        for page in range(2, first["total_pages"] + 1)
+        for task in client.get("/api/task/", params={"search": "deploy", "size": 2, "page": page}, headers=admin_headers).json()["data"]["tasks"]
+    ]
+    assert len(ids) == len(set(ids)) == 5
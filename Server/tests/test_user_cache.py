@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import manage
+from app.core.database import SessionLocal
+from app.core.security import create_access_token
+from app.core.user_cache import user_cache
+from app.models.user import User
+
+
+@pytest.fixture
+def member(create_user):
+    return create_user("member@example.com", "user")
+
+
+@pytest.fixture
+def member_headers(member) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'user_id': member.id})}"}
+
+
+def _current_role(client, headers) -> str:
+    response = client.get("/api/auth/me", headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["role"]
+
+
+def test_role_change_from_the_cli_reaches_cached_workers(client, member, member_headers, monkeypatch):
+    assert _current_role(client, member_headers) == "user"
+
+    published = []
+
+    def invalidate_user_sync(user_id):
+        # No Redis in tests: deliver the broadcast the way each worker's listener does
+        published.append(user_id)
+        user_cache.evict_local(user_id)
+
+    answers = iter([member.email, "admin", "y"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    monkeypatch.setattr(manage, "invalidate_user_sync", invalidate_user_sync)
+    manage.change_user_role()
+
+    assert published == [member.id]
+    assert _current_role(client, member_headers) == "admin"
+
+
+def test_otp_verification_evicts_the_cached_account(client, member, member_headers):
+    with SessionLocal() as db:
+        user = db.get(User, member.id)
+        user.is_verified = False
+        user.otp = "123456"
+        user.otp_expiry = datetime.utcnow() + timedelta(minutes=5)
+        db.commit()
+
+    _current_role(client, member_headers)
+    assert user_cache._get_local(member.id)["is_verified"] is False
+
+    response = client.post("/api/auth/verify-otp", params={"email": member.email, "otp": "123456"})
+    assert response.status_code == 200, response.text
+    assert user_cache._get_local(member.id) is None
+
+    _current_role(client, member_headers)
+    assert user_cache._get_local(member.id)["is_verified"] is True
@@ -0,0 +1,38 @@
+import pytest
+
+
+@pytest.fixture
+def directory(create_user, admin):
+    for email in ("carol@example.com", "a_b@example.com", "axb@example.com", "100%@example.com", "1000@example.com"):
+        create_user(email, "user")
+
+
+def _emails(client, headers, **params) -> list[str]:
+    """Emails of every directory page, following next_cursor"""
+    data = client.get("/api/auth/users", params=params, headers=headers).json()["data"]
+    emails = [user["email"] for user in data["users"]]
+    while data.get("next_cursor"):
+        data = client.get("/api/auth/users", params={**params, "after": data["next_cursor"]}, headers=headers).json()["data"]
+        emails += [user["email"] for user in data["users"]]
+    return emails
+
+
+def test_directory_pages_by_email_without_gaps(client, admin_headers, directory):
+    first = client.get("/api/auth/users", params={"size": 2}, headers=admin_headers).json()["data"]
+    assert len(first["users"]) == 2
+    assert first["next_cursor"]
+
+    emails = _emails(client, admin_headers, size=2)
+    assert emails == sorted(emails)
+    assert len(emails) == len(set(emails)) == 6
+
+
+def test_prefix_search_treats_like_wildcards_literally(client, admin_headers, directory):
+    assert _emails(client, admin_headers, search="a_") == ["a_b@example.com"]
+    assert _emails(client, admin_headers, search="100%") == ["100%@example.com"]
+    assert _emails(client, admin_headers, search="CAR") == ["carol@example.com"]
+
+
+def test_every_search_word_must_match(client, admin_headers, directory):
+    assert _emails(client, admin_headers, search="axb axb@") == ["axb@example.com"]
+    assert _emails(client, admin_headers, search="axb carol") == []
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
+import { useMutation, useQuery, useInfiniteQuery, useQueryClient } from '@tanstack/react-query';
 import { taskService } from '../../services/taskService';
 import { projectService } from '../../services/projectService';
 import { authService } from '../../services/authService';
@@ -11,6 +11,9 @@ import { QUERY_KEYS, TASK_STATUS } from '../../utils/constants';
 import { getErrorMessage } from '../../utils/helpers';
 import toast from 'react-hot-toast';
 
+// Users fetched per directory page; type to narrow the list
+const USER_PAGE_SIZE = 50;
+
 const TaskModal = ({ isOpen, onClose, task = null, projectId = null }) => {
   const [formData, setFormData] = useState({
     title: '',
@@ -29,12 +32,30 @@ const TaskModal = ({ isOpen, onClose, task = null, projectId = null }) => {
     queryFn: () => projectService.getProjects({ size: 100 }),
   });
 
-  const { data: usersData } = useQuery({
-    queryKey: [QUERY_KEYS.USERS],
-    queryFn: () => authService.getAllUsers(),
-  });
+  const [userSearch, setUserSearch] = useState('');
+  const [debouncedUserSearch, setDebouncedUserSearch] = useState('');
+
+  useEffect(() => {
+    const timeout = setTimeout(() => setDebouncedUserSearch(userSearch.trim()), 300);
+    return () => clearTimeout(timeout);
+  }, [userSearch]);
 
-  console.log("users data", usersData);
+  const {
+    data: usersData,
+    fetchNextPage: fetchMoreUsers,
+    hasNextPage: hasMoreUsers,
+    isFetchingNextPage: isFetchingMoreUsers,
+  } = useInfiniteQuery({
+    queryKey: [QUERY_KEYS.USERS, debouncedUserSearch],
+    queryFn: ({ pageParam }) => authService.getUsers({
+      search: debouncedUserSearch || undefined,
+      size: USER_PAGE_SIZE,
+      after: pageParam,
+    }),
+    initialPageParam: undefined,
+    getNextPageParam: (lastPage) => lastPage.data.next_cursor ?? undefined,
+    enabled: isOpen,
+  });
 
   useEffect(() => {
     if (task) {
@@ -110,10 +131,15 @@ const TaskModal = ({ isOpen, onClose, task = null, projectId = null }) => {
     label: project.title,
   })) || [];
 
-  const userOptions = usersData?.data?.map(user => ({
+  const users = usersData?.pages.flatMap(page => page.data.users) || [];
+  const userOptions = users.map(user => ({
     value: user.id,
-    label: `${user.first_name} (${user.role === 'admin' ? 'Admin' : 'User'}) - ${user.email}`,
-  })) || [];
+    label: `${user.first_name ?? ''} (${user.role === 'admin' ? 'Admin' : 'User'}) - ${user.email}`,
+  }));
+  // Keep the current assignee selectable when it is not on the loaded pages
+  if (formData.assigned_to && !users.some(user => user.id === parseInt(formData.assigned_to))) {
+    userOptions.unshift({ value: formData.assigned_to, label: `User #${formData.assigned_to}` });
+  }
 
   return (
     <Modal
@@ -170,17 +196,35 @@ const TaskModal = ({ isOpen, onClose, task = null, projectId = null }) => {
         </div>
 
         <div className="grid grid-cols-2 gap-4">
-          <Select
-            label="Assigned To (User ID)"
-            name="assigned_to"
-            value={formData.assigned_to}
-            onChange={handleChange}
-            options={[
-              { value: '', label: 'Select User' },
-              ...userOptions,
-            ]}
-            required
-          />
+          <div className="space-y-2">
+            <Input
+              label="Assigned To"
+              value={userSearch}
+              onChange={(e) => setUserSearch(e.target.value)}
+              placeholder="Search by name or email"
+              onKeyDown={(e) => e.key === 'Enter' && e.preventDefault()}
+            />
+            <Select
+              name="assigned_to"
+              value={formData.assigned_to}
+              onChange={handleChange}
+              options={[
+                { value: '', label: 'Select User' },
+                ...userOptions,
+              ]}
+              required
+            />
+            {hasMoreUsers && (
+              <button
+                type="button"
+                onClick={() => fetchMoreUsers()}
+                disabled={isFetchingMoreUsers}
+                className="text-sm text-primary-600 hover:underline disabled:opacity-50"
+              >
+                {isFetchingMoreUsers ? 'Loading...' : 'Load more users'}
+              </button>
+            )}
+          </div>
 
           <Input
             label="Due Date"
@@ -13,7 +13,9 @@ export const SocketProvider = ({ children }) => {
     useEffect(() => {
         if (isAuthenticated && token) {
             const newSocket = io("http://localhost:8000", {
-                query: { token }
+                query: { token },
+                // Websocket only: long-polling needs sticky sessions across server workers
+                transports: ["websocket"]
             });
             setSocket(newSocket);
             
@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import { useQuery, useQueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useQueryClient } from '@tanstack/react-query';
 import { FiArrowLeft, FiPlus, FiFilter, FiGrid, FiList } from 'react-icons/fi';
 import { projectService } from '../services/projectService';
 import TaskCard from '../components/tasks/TaskCard';
@@ -15,6 +15,8 @@ import { QUERY_KEYS, TASK_STATUS } from '../utils/constants';
 import { formatDate } from '../utils/helpers';
 import { useSocket } from '../contexts/socketContext';
 
+const TASK_PAGE_SIZE = 100;
+
 const ProjectDetail = () => {
   const { id } = useParams();
   const navigate = useNavigate();
@@ -30,8 +32,32 @@ const ProjectDetail = () => {
     queryFn: () => projectService.getProject(id),
   });
 
+  // The kanban shows every status; the list view filters on the server
+  const taskStatus = viewMode === 'list' ? statusFilter : '';
+  const {
+    data: taskPages,
+    isLoading: tasksLoading,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: [QUERY_KEYS.PROJECT_DETAIL, id, 'tasks', taskStatus],
+    queryFn: ({ pageParam }) => projectService.getProjectTasks(id, {
+      status: taskStatus || undefined,
+      size: TASK_PAGE_SIZE,
+      after: pageParam,
+    }),
+    initialPageParam: undefined,
+    getNextPageParam: (lastPage) => lastPage.data.next_cursor ?? undefined,
+  });
+
   useEffect(() => {
     if (socket) {
+      // Task events are only delivered to sockets in the project's room
+      const joinProject = () => socket.emit('join_project', { project_id: parseInt(id) });
+      joinProject();
+      socket.on('connect', joinProject);
+
       socket.on('task_created', (newTask) => {
         console.log('New task created:', newTask);
         
@@ -50,25 +76,39 @@ const ProjectDetail = () => {
         }
       });
 
+      // Bulk endpoints send one aggregated event per project
+      const onBulkChange = (change) => {
+        if (change.project_id === parseInt(id)) {
+          queryClient.invalidateQueries([QUERY_KEYS.PROJECT_DETAIL, id]);
+        }
+      };
+      socket.on('tasks_created', onBulkChange);
+      socket.on('tasks_updated', onBulkChange);
+      socket.on('tasks_deleted', onBulkChange);
+
       return () => {
+        socket.emit('leave_project', { project_id: parseInt(id) });
+        socket.off('connect', joinProject);
         socket.off('task_created');
         socket.off('task_updated');
+        socket.off('tasks_created', onBulkChange);
+        socket.off('tasks_updated', onBulkChange);
+        socket.off('tasks_deleted', onBulkChange);
       };
     }
   }, [socket, id, queryClient]);
 
   const project = data?.data;
-  const tasks = project?.tasks || [];
-  
-  const filteredTasks = statusFilter
-    ? tasks.filter(task => task.status === statusFilter)
-    : tasks;
+  const tasks = taskPages?.pages.flatMap((page) => page.data.tasks) || [];
+  const taskTotal = taskStatus
+    ? project?.status_counts?.[taskStatus] || 0
+    : project?.task_count || 0;
 
   const handleTaskClick = (task) => {
     setSelectedTask(task);
   };
 
-  if (isLoading) return <Loading />;
+  if (isLoading || tasksLoading) return <Loading />;
 
   return (
     <div className="space-y-6">
@@ -99,7 +139,7 @@ const ProjectDetail = () => {
 
       <div className="flex items-center justify-between flex-wrap gap-4">
         <h2 className="text-xl font-semibold text-gray-900">
-          Tasks ({filteredTasks.length})
+          Tasks ({taskTotal})
         </h2>
         <div className="flex items-center gap-3">
           <div className="flex items-center gap-2 bg-white border border-gray-200 rounded-lg p-1">
@@ -151,7 +191,7 @@ const ProjectDetail = () => {
           <KanbanBoard tasks={tasks} projectId={parseInt(id)} />
         ) : (
           <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-            {filteredTasks.map((task) => (
+            {tasks.map((task) => (
               <TaskCard
                 key={task.id}
                 task={task}
@@ -173,6 +213,18 @@ const ProjectDetail = () => {
         />
       )}
 
+      {hasNextPage && (
+        <div className="flex justify-center">
+          <Button
+            variant="secondary"
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+          >
+            {isFetchingNextPage ? 'Loading...' : `Load more tasks (${tasks.length} of ${taskTotal})`}
+          </Button>
+        </div>
+      )}
+
       <TaskModal
         isOpen={showTaskModal}
         onClose={() => setShowTaskModal(false)}
@@ -17,8 +17,8 @@ export const authService = {
     return response.data;
   },
 
-  getAllUsers: async () => {
-    const response = await api.get('/api/auth/users');
+  getUsers: async (params) => {
+    const response = await api.get('/api/auth/users', { params });
     return response.data;
   },
 
@@ -6,8 +6,13 @@ export const projectService = {
     return response.data;
   },
 
-  getProject: async (id) => {
-    const response = await api.get(`/api/project/${id}`);
+  getProject: async (id, params) => {
+    const response = await api.get(`/api/project/${id}`, { params });
+    return response.data;
+  },
+
+  getProjectTasks: async (id, params) => {
+    const response = await api.get(`/api/project/${id}/tasks`, { params });
     return response.data;
   },
 